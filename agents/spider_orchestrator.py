@@ -6,7 +6,7 @@ Main coordination agent that manages data collection from various sources
 
 import logging
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any
 from datetime import datetime
 from parsers.pubmed_parser import PubMedParser
@@ -106,9 +106,7 @@ class SpiderOrchestrator:
         """Collect documents for a specific query"""
         logger.info(f"Collecting documents for query: '{query}' (theme: {theme})")
         
-        all_documents = []
-        
-        # Collect from each parser
+        active_parsers = {}
         for parser_name, parser in self.parsers.items():
             if not self.is_running:
                 break
@@ -116,24 +114,27 @@ class SpiderOrchestrator:
             if not parser.should_update():
                 logger.debug(f"Skipping {parser_name} - update not needed")
                 continue
-            
-            try:
-                logger.info(f"Running parser: {parser_name}")
-                documents = parser.parse(query, max_results=10)
-                
-                if documents:
-                    logger.info(f"{parser_name} returned {len(documents)} documents")
-                    all_documents.extend(documents)
-                    self.stats['successful_parsings'] += 1
-                else:
-                    logger.warning(f"{parser_name} returned no documents")
-                
-            except Exception as e:
-                logger.error(f"Error running parser {parser_name}: {e}")
+            active_parsers[parser_name] = parser
+        
+        per_parser_results = {}
+        
+        # Parsers hit independent hosts, so run them concurrently; each parser
+        # enforces its own per-source rate limit
+        for parser_name, documents, error in self._run_parsers(active_parsers, query, max_results=10):
+            if error is not None:
+                logger.error(f"Error running parser {parser_name}: {error}")
                 self.stats['failed_parsings'] += 1
-            
-            # Rate limiting between parsers
-            time.sleep(1)
+            elif documents:
+                logger.info(f"{parser_name} returned {len(documents)} documents")
+                per_parser_results[parser_name] = documents
+                self.stats['successful_parsings'] += 1
+            else:
+                logger.warning(f"{parser_name} returned no documents")
+        
+        # Keep results in parser order regardless of completion order
+        all_documents = []
+        for parser_name in active_parsers:
+            all_documents.extend(per_parser_results.get(parser_name, []))
         
         # Process collected documents
         if all_documents:
@@ -141,6 +142,24 @@ class SpiderOrchestrator:
         
         self.stats['total_documents'] += len(all_documents)
     
+    def _run_parsers(self, parsers: Dict[str, Any], query: str, max_results: int):
+        """Run parsers concurrently, yielding (name, documents, error) as each finishes"""
+        if not parsers:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(parsers)) as executor:
+            futures = {
+                executor.submit(parser.parse, query, max_results=max_results): parser_name
+                for parser_name, parser in parsers.items()
+            }
+            
+            for future in as_completed(futures):
+                parser_name = futures[future]
+                try:
+                    yield parser_name, future.result(), None
+                except Exception as e:
+                    yield parser_name, [], e
+    
     def _process_documents(self, documents: List, query: str, theme: str):
         """Process collected documents through analysis pipeline"""
         logger.info(f"Processing {len(documents)} documents for theme: {theme}")
@@ -197,19 +216,20 @@ class SpiderOrchestrator:
         """Run a single query across all parsers (for interactive use)"""
         logger.info(f"Running single query: '{query}'")
         
-        all_documents = []
+        per_parser_results = {}
         
-        for parser_name, parser in self.parsers.items():
-            try:
-                logger.info(f"Querying {parser_name}...")
-                documents = parser.parse(query, max_results=max_results//len(self.parsers))
-                
-                if documents:
-                    all_documents.extend(documents)
-                    logger.info(f"{parser_name}: {len(documents)} documents")
-                
-            except Exception as e:
-                logger.error(f"Error querying {parser_name}: {e}")
+        logger.info(f"Querying {len(self.parsers)} parsers concurrently...")
+        for parser_name, documents, error in self._run_parsers(self.parsers, query, max_results//len(self.parsers)):
+            if error is not None:
+                logger.error(f"Error querying {parser_name}: {error}")
+            elif documents:
+                per_parser_results[parser_name] = documents
+                logger.info(f"{parser_name}: {len(documents)} documents")
+        
+        # Keep results in parser order regardless of completion order
+        all_documents = []
+        for parser_name in self.parsers:
+            all_documents.extend(per_parser_results.get(parser_name, []))
         
         # Process documents
         if all_documents:
@@ -18,6 +18,18 @@ logger = logging.getLogger(__name__)
 class KnowledgeSynthesis:
     """Main knowledge base for the ImmortyX system"""
     
+    INSERT_DOCUMENT_SQL = '''
+        INSERT OR REPLACE INTO documents 
+        (id, title, content, source, url, authors, publication_date, 
+         document_type, research_theme, search_query, metadata, created_at, embedding_vector)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    INSERT_ENTITY_SQL = '''
+        INSERT INTO entities (document_id, category, entity, confidence, context)
+        VALUES (?, ?, ?, ?, ?)
+    '''
+    
     def __init__(self, db_path: str = None):
         self.db_path = db_path or "data/knowledge_base.db"
         self.text_processor = TextProcessor()
@@ -31,12 +43,24 @@ class KnowledgeSynthesis:
         
         logger.info(f"Knowledge synthesis database initialized at {self.db_path}")
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with WAL-friendly durability settings"""
+        conn = sqlite3.connect(self.db_path)
+        # In WAL mode NORMAL only syncs at checkpoints, so each committed batch
+        # costs one WAL append instead of a full fsync
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
     def _init_database(self):
         """Initialize the SQLite database schema"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
+                # Write-ahead logging lets the chat interface read while the
+                # orchestrator stores a batch (persisted in the database file)
+                cursor.execute('PRAGMA journal_mode=WAL')
+                
                 # Documents table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS documents (
@@ -56,6 +80,13 @@ class KnowledgeSynthesis:
                     )
                 ''')
                 
+                # Partial index for per-theme statistics (NULL themes are never queried)
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_documents_research_theme
+                    ON documents (research_theme)
+                    WHERE research_theme IS NOT NULL
+                ''')
+                
                 # Entities table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS entities (
@@ -69,6 +100,10 @@ class KnowledgeSynthesis:
                     )
                 ''')
                 
+                # Lookup indexes for entity replacement and date-ordered search
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_entities_document_id ON entities (document_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_documents_publication_date ON documents (publication_date DESC)')
+                
                 # Knowledge graph table (simplified)
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS knowledge_graph (
@@ -104,12 +139,13 @@ class KnowledgeSynthesis:
     def store_documents(self, documents: List, theme: str = None):
         """Store documents in the knowledge base"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                for doc in documents:
-                    # Prepare document data
-                    doc_data = (
+                # Prepare document rows so the insert is prepared once for the batch
+                created_at = datetime.now().isoformat()
+                doc_rows = [
+                    (
                         doc.document_id,
                         doc.title,
                         doc.content,
@@ -121,19 +157,17 @@ class KnowledgeSynthesis:
                         theme or doc.metadata.get('research_theme'),
                         doc.metadata.get('search_query'),
                         json.dumps(doc.metadata),
-                        datetime.now().isoformat(),
+                        created_at,
                         None  # embedding_vector - to be implemented
                     )
-                    
-                    # Insert or update document
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO documents 
-                        (id, title, content, source, url, authors, publication_date, 
-                         document_type, research_theme, search_query, metadata, created_at, embedding_vector)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', doc_data)
-                    
-                    # Store entities if available
+                    for doc in documents
+                ]
+                
+                # Insert or update documents
+                cursor.executemany(self.INSERT_DOCUMENT_SQL, doc_rows)
+                
+                # Store entities if available
+                for doc in documents:
                     entities = doc.metadata.get('entities', {})
                     if entities:
                         self._store_entities(cursor, doc.document_id, entities)
@@ -151,12 +185,11 @@ class KnowledgeSynthesis:
             cursor.execute('DELETE FROM entities WHERE document_id = ?', (document_id,))
             
             # Insert new entities
-            for category, entity_list in entities.items():
-                for entity in entity_list:
-                    cursor.execute('''
-                        INSERT INTO entities (document_id, category, entity, confidence, context)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (document_id, category, entity, 0.8, None))  # Default confidence
+            cursor.executemany(self.INSERT_ENTITY_SQL, [
+                (document_id, category, entity, 0.8, None)  # Default confidence
+                for category, entity_list in entities.items()
+                for entity in entity_list
+            ])
         
         except Exception as e:
             logger.warning(f"Error storing entities for document {document_id}: {e}")
@@ -187,7 +220,7 @@ class KnowledgeSynthesis:
         try:
             query_words = self.text_processor.clean_text(query).lower().split()
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Simple keyword search (can be enhanced with full-text search)
@@ -206,7 +239,7 @@ class KnowledgeSynthesis:
                 ''', search_terms + [limit])
                 
                 columns = [description[0] for description in cursor.description]
-                documents = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                documents = [dict(zip(columns, row)) for row in cursor]
                 
                 return documents
         
@@ -280,7 +313,7 @@ class KnowledgeSynthesis:
     def _store_interaction(self, user_profile: str, query: str, response: str, document_ids: List[str]):
         """Store user interaction for analysis"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO user_interactions 
@@ -295,7 +328,7 @@ class KnowledgeSynthesis:
     def get_statistics(self) -> Dict[str, Any]:
         """Get knowledge base statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Document counts
@@ -303,14 +336,14 @@ class KnowledgeSynthesis:
                 total_docs = cursor.fetchone()[0]
                 
                 cursor.execute('SELECT source, COUNT(*) FROM documents GROUP BY source')
-                source_counts = dict(cursor.fetchall())
+                source_counts = dict(cursor)
                 
                 cursor.execute('SELECT research_theme, COUNT(*) FROM documents WHERE research_theme IS NOT NULL GROUP BY research_theme')
-                theme_counts = dict(cursor.fetchall())
+                theme_counts = dict(cursor)
                 
                 # Entity counts
                 cursor.execute('SELECT category, COUNT(*) FROM entities GROUP BY category')
-                entity_counts = dict(cursor.fetchall())
+                entity_counts = dict(cursor)
                 
                 return {
                     'total_documents': total_docs,
@@ -5,17 +5,52 @@ Fetches papers from arXiv in quantitative biology and related fields
 """
 
 import logging
-import requests
-import xml.etree.ElementTree as ET
+from io import BytesIO
 from typing import List, Dict, Any
-from datetime import datetime
-from parsers.base_parser import BaseParser, ParsedDocument
+from datetime import datetime, timezone
+from lxml import etree
+from parsers.base_parser import BaseParser, ParsedDocument, keyword_pattern
 
 logger = logging.getLogger(__name__)
 
+NAMESPACES = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+
+LONGEVITY_KEYWORDS = (
+    'aging', 'ageing', 'longevity', 'lifespan', 'senescence',
+    'gerontology', 'life extension', 'cellular aging', 'mortality',
+    'survival', 'age-related', 'telomere', 'caloric restriction',
+    'healthspan', 'rejuvenation', 'autophagy', 'oxidative stress',
+    'mitochondrial', 'dna damage', 'protein aggregation'
+)
+# Single alternation so relevance is decided in one scan of the text
+LONGEVITY_PATTERN = keyword_pattern(LONGEVITY_KEYWORDS)
+
+def _parse_arxiv_date(value: str) -> datetime:
+    """Parse an arXiv timestamp, slicing the fixed YYYY-MM-DDTHH:MM:SSZ layout directly"""
+    if len(value) == 20 and value[-1] == 'Z':
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=timezone.utc
+        )
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 class ArxivParser(BaseParser):
     """Parser for arXiv preprint server"""
     
+    # Compiled once; plain (non-smart) strings so results don't pin cleared entries
+    _X_TITLE = etree.XPath('atom:title/text()', namespaces=NAMESPACES, smart_strings=False)
+    _X_SUMMARY = etree.XPath('atom:summary/text()', namespaces=NAMESPACES, smart_strings=False)
+    _X_AUTHORS = etree.XPath('atom:author/atom:name/text()', namespaces=NAMESPACES, smart_strings=False)
+    _X_PUBLISHED = etree.XPath('atom:published/text()', namespaces=NAMESPACES, smart_strings=False)
+    _X_ID = etree.XPath('atom:id/text()', namespaces=NAMESPACES, smart_strings=False)
+    _X_CATEGORIES = etree.XPath('atom:category/@term', namespaces=NAMESPACES, smart_strings=False)
+    _X_DOI = etree.XPath('arxiv:doi/text()', namespaces=NAMESPACES, smart_strings=False)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("arxiv", config)
         self.base_url = "http://export.arxiv.org/api/query"
@@ -73,95 +108,88 @@ class ArxivParser(BaseParser):
                 'sortOrder': 'descending'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            self._throttle()
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
-            # Parse XML response
-            root = ET.fromstring(response.content)
-            
-            # Define namespaces
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
-            
-            entries = root.findall('atom:entry', namespaces)
-            
-            for entry in entries:
-                try:
-                    # Title
-                    title_elem = entry.find('atom:title', namespaces)
-                    title = title_elem.text.strip() if title_elem is not None else "No title"
-                    
-                    # Abstract
-                    summary_elem = entry.find('atom:summary', namespaces)
-                    abstract = summary_elem.text.strip() if summary_elem is not None else "No abstract"
-                    
-                    # Authors
-                    authors = []
-                    for author_elem in entry.findall('atom:author', namespaces):
-                        name_elem = author_elem.find('atom:name', namespaces)
-                        if name_elem is not None:
-                            authors.append(name_elem.text.strip())
-                    
-                    # Publication date
-                    pub_date = None
-                    published_elem = entry.find('atom:published', namespaces)
-                    if published_elem is not None:
-                        try:
-                            pub_date = datetime.fromisoformat(published_elem.text.replace('Z', '+00:00'))
-                        except ValueError:
-                            logger.warning(f"Could not parse date: {published_elem.text}")
-                    
-                    # arXiv ID and URL
-                    id_elem = entry.find('atom:id', namespaces)
-                    arxiv_url = id_elem.text if id_elem is not None else None
-                    arxiv_id = arxiv_url.split('/')[-1] if arxiv_url else None
-                    
-                    # Categories
-                    categories = []
-                    for category_elem in entry.findall('atom:category', namespaces):
-                        term = category_elem.get('term')
-                        if term:
-                            categories.append(term)
-                    
-                    # DOI if available
-                    doi = None
-                    doi_elem = entry.find('arxiv:doi', namespaces)
-                    if doi_elem is not None:
-                        doi = doi_elem.text
-                    
-                    # Metadata
-                    metadata = {
-                        'arxiv_id': arxiv_id,
-                        'categories': categories,
-                        'doi': doi,
-                        'source_type': 'preprint'
-                    }
-                    
-                    # Create document
-                    document = ParsedDocument(
-                        title=title,
-                        content=abstract,
-                        source=self.name,
-                        url=arxiv_url,
-                        authors=authors,
-                        publication_date=pub_date,
-                        document_type="preprint",
-                        metadata=metadata
-                    )
-                    
-                    documents.append(document)
-                
-                except Exception as e:
-                    logger.warning(f"Error parsing individual arXiv entry: {e}")
-                    continue
+            documents = self._parse_feed(response.content)
         
         except Exception as e:
             logger.error(f"Error searching arXiv: {e}")
         
         return documents
     
+    def _parse_feed(self, content: bytes) -> List[ParsedDocument]:
+        """Stream entries out of an Atom feed, freeing each one once parsed"""
+        documents = []
+        
+        for _, entry in etree.iterparse(BytesIO(content), events=('end',), tag=ATOM_ENTRY):
+            try:
+                documents.append(self._parse_entry(entry))
+            except Exception as e:
+                logger.warning(f"Error parsing individual arXiv entry: {e}")
+            
+            # Drop the entry and any already-processed siblings so memory stays
+            # flat regardless of page size
+            entry.clear(keep_tail=True)
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+        
+        return documents
+    
+    def _parse_entry(self, entry) -> ParsedDocument:
+        """Build a document from a single Atom entry"""
+        # Title
+        title = self._X_TITLE(entry)
+        title = title[0].strip() if title else "No title"
+        
+        # Abstract
+        abstract = self._X_SUMMARY(entry)
+        abstract = abstract[0].strip() if abstract else "No abstract"
+        
+        # Authors
+        authors = [name.strip() for name in self._X_AUTHORS(entry)]
+        
+        # Publication date
+        pub_date = None
+        published = self._X_PUBLISHED(entry)
+        if published:
+            try:
+                pub_date = _parse_arxiv_date(published[0])
+            except ValueError:
+                logger.warning(f"Could not parse date: {published[0]}")
+        
+        # arXiv ID and URL
+        arxiv_url = self._X_ID(entry)
+        arxiv_url = arxiv_url[0] if arxiv_url else None
+        arxiv_id = arxiv_url.split('/')[-1] if arxiv_url else None
+        
+        # Categories
+        categories = [term for term in self._X_CATEGORIES(entry) if term]
+        
+        # DOI if available
+        doi = self._X_DOI(entry)
+        doi = doi[0] if doi else None
+        
+        # Metadata
+        metadata = {
+            'arxiv_id': arxiv_id,
+            'categories': categories,
+            'doi': doi,
+            'source_type': 'preprint'
+        }
+        
+        return ParsedDocument(
+            title=title,
+            content=abstract,
+            source=self.name,
+            url=arxiv_url,
+            authors=authors,
+            publication_date=pub_date,
+            document_type="preprint",
+            metadata=metadata
+        )
+    
     def validate_document(self, document: ParsedDocument) -> bool:
         """Validate arXiv document"""
         try:
@@ -173,18 +201,7 @@ class ArxivParser(BaseParser):
                 return False
             
             # Check for longevity/aging related content
-            longevity_keywords = [
-                'aging', 'ageing', 'longevity', 'lifespan', 'senescence',
-                'gerontology', 'life extension', 'cellular aging', 'mortality',
-                'survival', 'age-related', 'telomere', 'caloric restriction',
-                'healthspan', 'rejuvenation', 'autophagy', 'oxidative stress',
-                'mitochondrial', 'dna damage', 'protein aggregation'
-            ]
-            
-            text_lower = (document.title + " " + document.content).lower()
-            matches = sum(1 for keyword in longevity_keywords if keyword in text_lower)
-            
-            return matches > 0
+            return LONGEVITY_PATTERN.search(document.text_lower) is not None
         
         except Exception as e:
             logger.warning(f"Error validating document: {e}")
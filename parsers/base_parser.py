@@ -4,19 +4,41 @@ Base parser class for ImmortyX system
 Abstract base class for all data source parsers
 """
 
+import asyncio
+import hashlib
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime
+import threading
 import time
 import os
-import json
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+def keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one any-hit alternation, dropping those that contain a shorter keyword"""
+    unique = list(dict.fromkeys(keywords))
+    # 'cellular aging' can only match where 'aging' already does, so it adds
+    # nothing to a yes/no search (not suitable for counting distinct hits)
+    kept = [kw for kw in unique if not any(other != kw and other in kw for other in unique)]
+    return re.compile('|'.join(map(re.escape, kept)))
+
 class ParsedDocument:
     """Data structure for parsed documents"""
     
+    __slots__ = (
+        'title', 'content', 'source', 'url', 'authors', 'publication_date',
+        'document_type', 'metadata', 'parsed_date', '_document_id', '_text_lower'
+    )
+    
     def __init__(self, 
                  title: str,
                  content: str,
@@ -35,16 +57,50 @@ class ParsedDocument:
         self.document_type = document_type
         self.metadata = metadata or {}
         self.parsed_date = datetime.now()
-        self.document_id = self._generate_id()
+        self._document_id = None
+        self._text_lower = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ParsedDocument':
+        """Rebuild a document from to_dict output, keeping its stored ID and dates"""
+        doc = cls.__new__(cls)
+        doc.title = data['title']
+        doc.content = data['content']
+        doc.source = data['source']
+        doc.url = data.get('url')
+        doc.authors = list(data.get('authors') or [])
+        publication_date = data.get('publication_date')
+        doc.publication_date = datetime.fromisoformat(publication_date) if publication_date else datetime.now()
+        doc.document_type = data.get('document_type', 'article')
+        doc.metadata = dict(data.get('metadata') or {})
+        parsed_date = data.get('parsed_date')
+        doc.parsed_date = datetime.fromisoformat(parsed_date) if parsed_date else datetime.now()
+        doc._document_id = data.get('document_id')
+        doc._text_lower = None
+        return doc
+    
+    @property
+    def document_id(self) -> str:
+        """Unique document ID, hashed on first access"""
+        if self._document_id is None:
+            self._document_id = self._generate_id()
+        return self._document_id
+    
+    @property
+    def text_lower(self) -> str:
+        """Lowercased title and content, built on first access"""
+        if self._text_lower is None:
+            self._text_lower = f"{self.title} {self.content}".lower()
+        return self._text_lower
     
     def _generate_id(self) -> str:
         """Generate unique document ID"""
-        import hashlib
-        content_hash = hashlib.md5(f"{self.title}{self.source}{self.url}".encode()).hexdigest()
-        return f"{self.source}_{content_hash[:12]}"
+        content_hash = hashlib.blake2b(f"{self.title}{self.source}{self.url}".encode(), digest_size=6).hexdigest()
+        return f"{self.source}_{content_hash}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage"""
+        publication_date = self.publication_date
         return {
             'document_id': self.document_id,
             'title': self.title,
@@ -52,7 +108,7 @@ class ParsedDocument:
             'source': self.source,
             'url': self.url,
             'authors': self.authors,
-            'publication_date': self.publication_date.isoformat() if self.publication_date else None,
+            'publication_date': publication_date.isoformat() if publication_date else None,
             'document_type': self.document_type,
             'metadata': self.metadata,
             'parsed_date': self.parsed_date.isoformat()
@@ -61,6 +117,12 @@ class ParsedDocument:
 class BaseParser(ABC):
     """Abstract base class for all parsers"""
     
+    # Directories already created in this process, shared by all parsers
+    _ensured_dirs = set()
+    
+    # Decoded sample data files shared by all parsers: path -> (mtime, records)
+    _sample_data_cache = {}
+    
     def __init__(self, name: str, config: Dict[str, Any] = None):
         self.name = name
         self.config = config or {}
@@ -70,18 +132,109 @@ class BaseParser(ABC):
         self.cache_dir = self.config.get('cache_dir', 'data/cache')
         self.sample_data_dir = self.config.get('sample_data_dir', 'data/sample_data')
         self.use_cache = self.config.get('use_cache', True)
+        self.memory_cache_size = self.config.get('memory_cache_size', 128)
+        
+        # Recently used cache entries kept in memory: query -> (saved_at, document data)
+        self._memory_cache = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        
+        # Memoized sample-data results: (query, max_results, sample mtime) -> document data
+        self._sample_parse_memo = OrderedDict()
+        self._sample_parse_memo_lock = threading.Lock()
         
         # Create cache directory if it doesn't exist
-        os.makedirs(self.cache_dir, exist_ok=True)
-        os.makedirs(self.sample_data_dir, exist_ok=True)
+        self._ensure_dir(self.cache_dir)
+        self._ensure_dir(self.sample_data_dir)
+        
+        # Requests per second; subclasses set their own default
+        self.rate_limit = self.config.get('rate_limit')
+        
+        # Requests allowed back to back before pacing starts; 1 means strict 1/rate spacing
+        self.rate_burst = self.config.get('rate_burst', 1)
+        
+        # Token bucket state for _throttle
+        self._bucket_tokens = 0.0
+        self._bucket_updated = None
+        self._throttle_lock = threading.Lock()
+        
+        # Pooled HTTP session so repeated requests reuse TCP/TLS connections
+        self.session = self._create_session()
         
         logger.info(f"Initialized parser: {self.name}")
     
+    @classmethod
+    def _ensure_dir(cls, path: str):
+        """Create a directory once per process"""
+        if path not in cls._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            cls._ensured_dirs.add(path)
+    
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by this parser's requests"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            # Back off on throttling and transient server errors; every request
+            # made here is a read, so POSTs (e.g. PubMed efetch) are safe to retry
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'GET', 'POST'}),
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['User-Agent'] = 'ImmortyX/1.0'
+        return session
+    
+    def _throttle(self):
+        """Block until the token bucket allows another request to this source"""
+        rate = self.rate_limit
+        if not rate:
+            return
+        
+        with self._throttle_lock:
+            now = time.monotonic()
+            capacity = max(self.rate_burst, 1)
+            if self._bucket_updated is None:
+                self._bucket_tokens = capacity
+            else:
+                self._bucket_tokens = min(capacity, self._bucket_tokens + (now - self._bucket_updated) * rate)
+            self._bucket_updated = now
+            
+            # Waiting under the lock keeps concurrent callers in order
+            if self._bucket_tokens < 1:
+                wait = (1 - self._bucket_tokens) / rate
+                time.sleep(wait)
+                self._bucket_tokens = 1
+                self._bucket_updated = now + wait
+            
+            self._bucket_tokens -= 1
+    
     @abstractmethod
     def parse(self, query: str, max_results: int = 10) -> List[ParsedDocument]:
         """Parse documents from the data source"""
         pass
     
+    def parse_many(self, queries: List[str], max_results: int = 10) -> Dict[str, List[ParsedDocument]]:
+        """Parse several queries concurrently, returning results keyed by query"""
+        unique_queries = list(dict.fromkeys(queries))
+        if len(unique_queries) <= 1:
+            return {query: self.parse(query, max_results) for query in unique_queries}
+        
+        # Requests still pass through _throttle, so the source's rate limit holds
+        max_workers = min(len(unique_queries), self.config.get('max_workers', 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda query: self.parse(query, max_results), unique_queries)
+            return dict(zip(unique_queries, results))
+    
+    async def aparse(self, query: str, max_results: int = 10) -> List[ParsedDocument]:
+        """Run parse in a worker thread so several sources can be awaited together"""
+        return await asyncio.to_thread(self.parse, query, max_results)
+    
     @abstractmethod
     def validate_document(self, document: ParsedDocument) -> bool:
         """Validate that a document meets quality criteria"""
@@ -104,8 +257,7 @@ class BaseParser(ABC):
     
     def get_cache_path(self, query: str) -> str:
         """Get cache file path for a query"""
-        import hashlib
-        query_hash = hashlib.md5(query.encode()).hexdigest()
+        query_hash = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
         return os.path.join(self.cache_dir, f"{self.name}_{query_hash}.json")
     
     def load_from_cache(self, query: str, max_age: int = 3600) -> Optional[List[ParsedDocument]]:
@@ -113,38 +265,55 @@ class BaseParser(ABC):
         if not self.use_cache:
             return None
         
-        cache_path = self.get_cache_path(query)
-        
         try:
-            if os.path.exists(cache_path):
+            cached_data = self._get_memory_cache(query, max_age)
+            
+            if cached_data is None:
+                cache_path = self.get_cache_path(query)
+                try:
+                    cache_mtime = os.stat(cache_path).st_mtime
+                except FileNotFoundError:
+                    return None
+                
                 # Check if cache is not expired
-                cache_age = time.time() - os.path.getmtime(cache_path)
-                if cache_age <= max_age:
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        cached_data = json.load(f)
-                    
-                    documents = []
-                    for doc_data in cached_data:
-                        doc = ParsedDocument(
-                            title=doc_data['title'],
-                            content=doc_data['content'],
-                            source=doc_data['source'],
-                            url=doc_data.get('url'),
-                            authors=doc_data.get('authors', []),
-                            publication_date=datetime.fromisoformat(doc_data['publication_date']) if doc_data.get('publication_date') else None,
-                            document_type=doc_data.get('document_type', 'article'),
-                            metadata=doc_data.get('metadata', {})
-                        )
-                        documents.append(doc)
-                    
-                    logger.info(f"Loaded {len(documents)} documents from cache for {self.name}")
-                    return documents
+                if time.time() - cache_mtime <= max_age:
+                    with open(cache_path, 'rb') as f:
+                        cached_data = json_utils.loads(f.read())
+                    self._set_memory_cache(query, cached_data, cache_mtime)
+            
+            if cached_data is not None:
+                documents = [ParsedDocument.from_dict(doc_data) for doc_data in cached_data]
+                
+                logger.info(f"Loaded {len(documents)} documents from cache for {self.name}")
+                return documents
         
         except Exception as e:
             logger.warning(f"Failed to load cache for {self.name}: {e}")
         
         return None
     
+    def _get_memory_cache(self, query: str, max_age: int) -> Optional[List[Dict[str, Any]]]:
+        """Return cached document data for a query if it is fresh enough"""
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(query)
+            if entry is None:
+                return None
+            
+            saved_at, doc_data = entry
+            if time.time() - saved_at > max_age:
+                return None
+            
+            self._memory_cache.move_to_end(query)
+            return doc_data
+    
+    def _set_memory_cache(self, query: str, doc_data: List[Dict[str, Any]], saved_at: float):
+        """Remember document data for a query, evicting the least recently used entry"""
+        with self._memory_cache_lock:
+            self._memory_cache[query] = (saved_at, doc_data)
+            self._memory_cache.move_to_end(query)
+            while len(self._memory_cache) > self.memory_cache_size:
+                self._memory_cache.popitem(last=False)
+    
     def save_to_cache(self, query: str, documents: List[ParsedDocument]):
         """Save results to cache"""
         if not self.use_cache:
@@ -154,8 +323,14 @@ class BaseParser(ABC):
         
         try:
             doc_data = [doc.to_dict() for doc in documents]
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(doc_data, f, indent=2, ensure_ascii=False)
+            # Serialize up front and write the compact bytes once
+            payload = json_utils.dumps(doc_data)
+            with open(cache_path, 'wb') as f:
+                f.write(payload)
+            
+            # Snapshot metadata so later in-place edits to the documents don't
+            # leak into the in-memory copy
+            self._set_memory_cache(query, [dict(data, metadata=dict(data['metadata'])) for data in doc_data], time.time())
             
             logger.info(f"Saved {len(documents)} documents to cache for {self.name}")
         
@@ -167,34 +342,62 @@ class BaseParser(ABC):
         sample_path = os.path.join(self.sample_data_dir, filename)
         
         try:
-            if os.path.exists(sample_path):
-                with open(sample_path, 'r', encoding='utf-8') as f:
-                    sample_data = json.load(f)
-                
-                documents = []
-                for doc_data in sample_data:
-                    doc = ParsedDocument(
-                        title=doc_data['title'],
-                        content=doc_data['content'],
-                        source=doc_data['source'],
-                        url=doc_data.get('url'),
-                        authors=doc_data.get('authors', []),
-                        publication_date=datetime.fromisoformat(doc_data['publication_date']) if doc_data.get('publication_date') else None,
-                        document_type=doc_data.get('document_type', 'article'),
-                        metadata=doc_data.get('metadata', {})
-                    )
-                    documents.append(doc)
-                
-                logger.info(f"Loaded {len(documents)} sample documents for {self.name}")
-                return documents
-            else:
+            try:
+                sample_mtime = os.stat(sample_path).st_mtime
+            except FileNotFoundError:
                 logger.warning(f"Sample data file not found: {sample_path}")
                 return []
+            
+            # Reuse the decoded file until it changes on disk
+            cached = BaseParser._sample_data_cache.get(sample_path)
+            if cached is not None and cached[0] == sample_mtime:
+                sample_data = cached[1]
+            else:
+                with open(sample_path, 'rb') as f:
+                    sample_data = json_utils.loads(f.read())
+                BaseParser._sample_data_cache[sample_path] = (sample_mtime, sample_data)
+            
+            documents = [ParsedDocument.from_dict(doc_data) for doc_data in sample_data]
+            
+            logger.info(f"Loaded {len(documents)} sample documents for {self.name}")
+            return documents
         
         except Exception as e:
             logger.error(f"Failed to load sample data for {self.name}: {e}")
             return []
     
+    def parse_sample_memoized(self, filename: str, query: str, max_results: int,
+                              compute: Callable[[], List[ParsedDocument]]) -> List[ParsedDocument]:
+        """Run compute() once per query and sample file version, returning fresh documents on every call"""
+        if not self.use_cache:
+            return compute()
+        
+        try:
+            sample_mtime = os.stat(os.path.join(self.sample_data_dir, filename)).st_mtime
+        except OSError:
+            sample_mtime = None
+        key = (query.lower().strip(), max_results, sample_mtime)
+        
+        with self._sample_parse_memo_lock:
+            doc_data = self._sample_parse_memo.get(key)
+            if doc_data is not None:
+                self._sample_parse_memo.move_to_end(key)
+        
+        if doc_data is None:
+            documents = compute()
+            # Snapshot so callers editing metadata don't change later results
+            doc_data = [
+                dict(data, metadata=dict(data['metadata']), authors=list(data['authors']))
+                for data in (doc.to_dict() for doc in documents)
+            ]
+            with self._sample_parse_memo_lock:
+                self._sample_parse_memo[key] = doc_data
+                while len(self._sample_parse_memo) > self.memory_cache_size:
+                    self._sample_parse_memo.popitem(last=False)
+            return documents
+        
+        return [ParsedDocument.from_dict(data) for data in doc_data]
+    
     def get_status(self) -> Dict[str, Any]:
         """Get parser status information"""
         return {
@@ -5,14 +5,23 @@ Fetches preprints from bioRxiv server
 """
 
 import logging
-import requests
-import json
 from typing import List, Dict, Any
 from datetime import datetime
-from parsers.base_parser import BaseParser, ParsedDocument
+from parsers.base_parser import BaseParser, ParsedDocument, keyword_pattern
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+LONGEVITY_KEYWORDS = (
+    'aging', 'ageing', 'longevity', 'lifespan', 'senescence',
+    'gerontology', 'anti-aging', 'life extension', 'cellular aging',
+    'telomere', 'caloric restriction', 'rapamycin', 'metformin',
+    'centenarian', 'longevity genes', 'aging biomarkers',
+    'healthspan', 'age-related', 'rejuvenation', 'autophagy'
+)
+# Single alternation so relevance is decided in one scan of the text
+LONGEVITY_PATTERN = keyword_pattern(LONGEVITY_KEYWORDS)
+
 class BioRxivParser(BaseParser):
     """Parser for bioRxiv preprint server"""
     
@@ -63,10 +72,12 @@ class BioRxivParser(BaseParser):
             
             url = f"{self.base_url}/{from_date}/{to_date}/0"
             
-            response = requests.get(url, timeout=30)
+            self._throttle()
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            # Decode the raw body directly (orjson when available)
+            data = json_utils.loads(response.content)
             
             if 'collection' not in data:
                 logger.warning("No collection found in bioRxiv response")
@@ -131,12 +142,13 @@ class BioRxivParser(BaseParser):
         if not query:
             return documents
         
-        query_words = [word.lower() for word in query.split()]
+        # Substring matches so 'telomere' still finds 'telomeres'
+        query_words = set(query.lower().split())
         filtered = []
         
         for doc in documents:
-            text = (doc.title + " " + doc.content).lower()
-            # Calculate relevance score
+            # Calculate relevance score as the number of distinct query words in the document
+            text = doc.text_lower
             matches = sum(1 for word in query_words if word in text)
             if matches > 0:
                 filtered.append((doc, matches))
@@ -155,19 +167,9 @@ class BioRxivParser(BaseParser):
             if not document.content or len(document.content.strip()) < 50:
                 return False
             
-            # Check for longevity/aging related content
-            longevity_keywords = [
-                'aging', 'ageing', 'longevity', 'lifespan', 'senescence',
-                'gerontology', 'anti-aging', 'life extension', 'cellular aging',
-                'telomere', 'caloric restriction', 'rapamycin', 'metformin',
-                'centenarian', 'longevity genes', 'aging biomarkers',
-                'healthspan', 'age-related', 'rejuvenation', 'autophagy'
-            ]
-            
-            text_lower = (document.title + " " + document.content).lower()
-            matches = sum(1 for keyword in longevity_keywords if keyword in text_lower)
-            
-            return matches > 0
+            # Check for longevity/aging related content; the lowercased text is
+            # already cached on the document by query filtering
+            return LONGEVITY_PATTERN.search(document.text_lower) is not None
         
         except Exception as e:
             logger.warning(f"Error validating document: {e}")
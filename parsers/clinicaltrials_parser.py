@@ -5,20 +5,66 @@ Fetches clinical trial information related to longevity research
 """
 
 import logging
-import requests
-import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
-from parsers.base_parser import BaseParser, ParsedDocument
+from parsers.base_parser import BaseParser, ParsedDocument, keyword_pattern
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+LONGEVITY_KEYWORDS = (
+    'aging', 'ageing', 'longevity', 'lifespan', 'anti-aging',
+    'age-related', 'elderly', 'geriatric', 'senescence',
+    'healthspan', 'frailty', 'cognitive decline', 'sarcopenia',
+    'osteoporosis', 'cardiovascular aging', 'metabolic aging',
+    'rapamycin', 'metformin', 'caloric restriction', 'exercise',
+    'hormone replacement', 'vitamin d', 'omega-3', 'resveratrol'
+)
+
+# Trials specifically related to older adults
+AGE_INDICATORS = ('65', '70', '75', '80', 'older adult', 'senior', 'geriatric')
+
+# Either list is enough, so both go into one alternation scanned once per document
+RELEVANCE_PATTERN = keyword_pattern(LONGEVITY_KEYWORDS + AGE_INDICATORS)
+
+# Study modules requested from the v2 API; everything else is left out of the response
+STUDY_FIELDS = (
+    'protocolSection.identificationModule',
+    'protocolSection.descriptionModule',
+    'protocolSection.conditionsModule',
+    'protocolSection.armsInterventionsModule',
+    'protocolSection.designModule',
+    'protocolSection.statusModule',
+    'protocolSection.sponsorCollaboratorsModule',
+    'protocolSection.outcomesModule'
+)
+
+# (label, descriptionModule key) pairs combined into the document content, in order
+CONTENT_SECTIONS = (
+    ('Brief Summary', 'briefSummary'),
+    ('Detailed Description', 'detailedDescription')
+)
+
+def _single_or_list(values: List[Any]) -> Any:
+    """Collapse single-item lists to the item, keeping the legacy metadata shape"""
+    if not values:
+        return None
+    return values[0] if len(values) == 1 else values
+
+def _parse_trial_date(value: str) -> datetime:
+    """Parse a v2 date ('YYYY-MM-DD' or 'YYYY-MM') by slicing its fixed layout"""
+    if len(value) == 10:
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    if len(value) == 7:
+        return datetime(int(value[0:4]), int(value[5:7]), 1)
+    return datetime.fromisoformat(value)
+
 class ClinicalTrialsParser(BaseParser):
     """Parser for ClinicalTrials.gov API"""
     
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("clinicaltrials", config)
-        self.base_url = "https://clinicaltrials.gov/api/query/study_fields"
+        self.base_url = "https://clinicaltrials.gov/api/v2/studies"
         self.rate_limit = self.config.get('rate_limit', 2)  # 2 requests per second
     
     def parse(self, query: str, max_results: int = 10) -> List[ParsedDocument]:
@@ -52,113 +98,116 @@ class ClinicalTrialsParser(BaseParser):
         documents = []
         
         try:
-            # Prepare search parameters
-            fields = [
-                'NCTId', 'OfficialTitle', 'BriefSummary', 'DetailedDescription',
-                'Condition', 'InterventionName', 'Phase', 'StudyType',
-                'OverallStatus', 'StartDate', 'CompletionDate', 'Sponsor',
-                'PrimaryOutcomeMeasure', 'SecondaryOutcomeMeasure'
-            ]
-            
+            # Prepare search parameters, projecting only the modules we read
             params = {
-                'expr': query,
-                'fields': ','.join(fields),
-                'min_rnk': '1',
-                'max_rnk': str(max_results),
-                'fmt': 'json'
+                'query.term': query,
+                'pageSize': max_results,
+                'fields': ','.join(STUDY_FIELDS),
+                'format': 'json'
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            self._throttle()
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            # Decode the raw body directly (orjson when available)
+            data = json_utils.loads(response.content)
             
-            if 'StudyFieldsResponse' not in data:
-                logger.warning("No StudyFieldsResponse found in API response")
+            if 'studies' not in data:
+                logger.warning("No studies found in API response")
                 return documents
             
-            study_fields = data['StudyFieldsResponse'].get('StudyFields', [])
-            
-            for study in study_fields:
-                try:
-                    # Extract study information
-                    fields_dict = {}
-                    for field in study.get('Fields', []):
-                        field_name = field.get('FieldName', '')
-                        field_values = field.get('FieldValues', [])
-                        if field_values:
-                            fields_dict[field_name] = field_values[0] if len(field_values) == 1 else field_values
-                    
-                    nct_id = fields_dict.get('NCTId', 'Unknown')
-                    title = fields_dict.get('OfficialTitle', 'No title')
-                    
-                    # Combine summary and description
-                    content_parts = []
-                    if fields_dict.get('BriefSummary'):
-                        content_parts.append(f"Brief Summary: {fields_dict['BriefSummary']}")
-                    if fields_dict.get('DetailedDescription'):
-                        content_parts.append(f"Detailed Description: {fields_dict['DetailedDescription']}")
-                    if fields_dict.get('PrimaryOutcomeMeasure'):
-                        content_parts.append(f"Primary Outcome: {fields_dict['PrimaryOutcomeMeasure']}")
-                    
-                    content = " ".join(content_parts) if content_parts else "No description available"
-                    
-                    # Parse dates
-                    pub_date = None
-                    start_date_str = fields_dict.get('StartDate')
-                    if start_date_str:
-                        try:
-                            pub_date = datetime.strptime(start_date_str, '%B %d, %Y')
-                        except ValueError:
-                            try:
-                                pub_date = datetime.strptime(start_date_str, '%B %Y')
-                            except ValueError:
-                                logger.warning(f"Could not parse start date: {start_date_str}")
-                    
-                    # Create URL
-                    url = f"https://clinicaltrials.gov/ct2/show/{nct_id}"
-                    
-                    # Extract sponsor/investigators as authors
-                    authors = []
-                    sponsor = fields_dict.get('Sponsor')
-                    if sponsor:
-                        authors.append(sponsor)
-                    
-                    # Metadata
-                    metadata = {
-                        'nct_id': nct_id,
-                        'condition': fields_dict.get('Condition'),
-                        'intervention': fields_dict.get('InterventionName'),
-                        'phase': fields_dict.get('Phase'),
-                        'study_type': fields_dict.get('StudyType'),
-                        'status': fields_dict.get('OverallStatus'),
-                        'completion_date': fields_dict.get('CompletionDate'),
-                        'source_type': 'clinical_trial'
-                    }
-                    
-                    # Create document
-                    document = ParsedDocument(
-                        title=title,
-                        content=content,
-                        source=self.name,
-                        url=url,
-                        authors=authors,
-                        publication_date=pub_date,
-                        document_type="clinical_trial",
-                        metadata=metadata
-                    )
-                    
+            for study in data['studies']:
+                document = self._build_document(study)
+                if document is not None:
                     documents.append(document)
-                
-                except Exception as e:
-                    logger.warning(f"Error parsing individual clinical trial: {e}")
-                    continue
         
         except Exception as e:
             logger.error(f"Error searching clinical trials: {e}")
         
         return documents
     
+    def _build_document(self, study: Dict[str, Any]) -> Optional[ParsedDocument]:
+        """Build a document from a single v2 study record"""
+        try:
+            # Extract study information
+            protocol = study.get('protocolSection', {})
+            identification = protocol.get('identificationModule', {})
+            description = protocol.get('descriptionModule', {})
+            status = protocol.get('statusModule', {})
+            design = protocol.get('designModule', {})
+            
+            nct_id = identification.get('nctId', 'Unknown')
+            title = identification.get('officialTitle') or identification.get('briefTitle') or 'No title'
+            
+            # Combine summary and description
+            content_parts = []
+            for label, key in CONTENT_SECTIONS:
+                value = description.get(key)
+                if value:
+                    content_parts.append(f"{label}: {value}")
+            primary_outcomes = [
+                outcome['measure']
+                for outcome in protocol.get('outcomesModule', {}).get('primaryOutcomes', [])
+                if outcome.get('measure')
+            ]
+            if primary_outcomes:
+                content_parts.append(f"Primary Outcome: {_single_or_list(primary_outcomes)}")
+            
+            content = " ".join(content_parts) if content_parts else "No description available"
+            
+            # Parse dates (v2 reports ISO dates, sometimes without the day)
+            pub_date = None
+            start_date_str = status.get('startDateStruct', {}).get('date')
+            if start_date_str:
+                try:
+                    pub_date = _parse_trial_date(start_date_str)
+                except ValueError:
+                    logger.warning(f"Could not parse start date: {start_date_str}")
+            
+            # Create URL
+            url = f"https://clinicaltrials.gov/study/{nct_id}"
+            
+            # Extract sponsor/investigators as authors
+            authors = []
+            sponsor = protocol.get('sponsorCollaboratorsModule', {}).get('leadSponsor', {}).get('name')
+            if sponsor:
+                authors.append(sponsor)
+            
+            interventions = [
+                intervention['name']
+                for intervention in protocol.get('armsInterventionsModule', {}).get('interventions', [])
+                if intervention.get('name')
+            ]
+            
+            # Metadata
+            metadata = {
+                'nct_id': nct_id,
+                'condition': _single_or_list(protocol.get('conditionsModule', {}).get('conditions', [])),
+                'intervention': _single_or_list(interventions),
+                'phase': _single_or_list(design.get('phases', [])),
+                'study_type': design.get('studyType'),
+                'status': status.get('overallStatus'),
+                'completion_date': status.get('completionDateStruct', {}).get('date'),
+                'source_type': 'clinical_trial'
+            }
+            
+            # Create document
+            return ParsedDocument(
+                title=title,
+                content=content,
+                source=self.name,
+                url=url,
+                authors=authors,
+                publication_date=pub_date,
+                document_type="clinical_trial",
+                metadata=metadata
+            )
+        
+        except Exception as e:
+            logger.warning(f"Error parsing individual clinical trial: {e}")
+            return None
+    
     def validate_document(self, document: ParsedDocument) -> bool:
         """Validate clinical trial document"""
         try:
@@ -169,24 +218,8 @@ class ClinicalTrialsParser(BaseParser):
             if not document.content or len(document.content.strip()) < 20:
                 return False
             
-            # Check for longevity/aging related content
-            longevity_keywords = [
-                'aging', 'ageing', 'longevity', 'lifespan', 'anti-aging',
-                'age-related', 'elderly', 'geriatric', 'senescence',
-                'healthspan', 'frailty', 'cognitive decline', 'sarcopenia',
-                'osteoporosis', 'cardiovascular aging', 'metabolic aging',
-                'rapamycin', 'metformin', 'caloric restriction', 'exercise',
-                'hormone replacement', 'vitamin d', 'omega-3', 'resveratrol'
-            ]
-            
-            text_lower = (document.title + " " + document.content).lower()
-            matches = sum(1 for keyword in longevity_keywords if keyword in text_lower)
-            
-            # Also check if it's specifically related to older adults
-            age_indicators = ['65', '70', '75', '80', 'older adult', 'senior', 'geriatric']
-            age_matches = sum(1 for indicator in age_indicators if indicator in text_lower)
-            
-            return matches > 0 or age_matches > 0
+            # Check for longevity/aging related content or an older-adult population
+            return RELEVANCE_PATTERN.search(document.text_lower) is not None
         
         except Exception as e:
             logger.warning(f"Error validating document: {e}")
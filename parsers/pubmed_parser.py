@@ -5,19 +5,49 @@ Uses PubMed E-utilities API to fetch biomedical literature
 """
 
 import logging
-import requests
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from io import BytesIO
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union, BinaryIO
 from datetime import datetime
-import time
-import re
-from parsers.base_parser import BaseParser, ParsedDocument
+from lxml import etree as LET
+from parsers.base_parser import BaseParser, ParsedDocument, keyword_pattern
 
 logger = logging.getLogger(__name__)
 
+LONGEVITY_KEYWORDS = (
+    'aging', 'ageing', 'longevity', 'lifespan', 'senescence',
+    'gerontology', 'anti-aging', 'life extension', 'cellular aging',
+    'telomere', 'caloric restriction', 'rapamycin', 'metformin',
+    'centenarian', 'longevity genes', 'aging biomarkers'
+)
+# Single alternation so relevance is decided in one scan of the text
+LONGEVITY_PATTERN = keyword_pattern(LONGEVITY_KEYWORDS)
+
+# E-utilities XML is trusted, flat and full of indentation: skip whitespace-only
+# text nodes, ID bookkeeping and entity expansion
+XML_PARSER_OPTIONS = {'remove_blank_text': True, 'collect_ids': False, 'resolve_entities': False}
+XML_PARSER = LET.XMLParser(**XML_PARSER_OPTIONS)
+
+# PubDate months come as abbreviations or numbers; one lookup covers both
+MONTH_MAP = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+MONTH_MAP.update({str(month): month for month in range(1, 13)})
+MONTH_MAP.update({f"{month:02d}": month for month in range(1, 10)})
+
 class PubMedParser(BaseParser):
     """Parser for PubMed E-utilities API"""
     
+    # Field extractors compiled once; fixed efetch paths so each lookup walks one
+    # branch instead of rescanning the article (and its reference list)
+    _X_PMID = LET.XPath('MedlineCitation/PMID/text()', smart_strings=False)
+    _X_TITLE = LET.XPath('MedlineCitation/Article/ArticleTitle/text()', smart_strings=False)
+    _X_ABSTRACT = LET.XPath('MedlineCitation/Article/Abstract/AbstractText')
+    _X_AUTHORS = LET.XPath('MedlineCitation/Article/AuthorList/Author[LastName and ForeName]')
+    _X_PUB_DATE = LET.XPath('MedlineCitation/Article/Journal/JournalIssue/PubDate')
+    _X_JOURNAL = LET.XPath('MedlineCitation/Article/Journal/Title/text()', smart_strings=False)
+    _X_DOI = LET.XPath('PubmedData/ArticleIdList/ArticleId[@IdType="doi"]/text()', smart_strings=False)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("pubmed", config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
@@ -25,18 +55,8 @@ class PubMedParser(BaseParser):
         self.tool = "ImmortyX"
         self.api_key = self.config.get('api_key')  # Optional NCBI API key
         self.rate_limit = self.config.get('rate_limit', 3)  # Requests per second
-        self.last_request_time = 0
-    
-    def _rate_limit_delay(self):
-        """Enforce rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        min_interval = 1.0 / self.rate_limit
-        
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-        
-        self.last_request_time = time.time()
+        self.efetch_batch_size = self.config.get('efetch_batch_size', 200)  # NCBI recommended max IDs per request
+        self.history_min_results = self.config.get('history_min_results', 50)  # Fetch via WebEnv from this many hits
     
     def parse(self, query: str, max_results: int = 10) -> List[ParsedDocument]:
         """Parse documents from PubMed"""
@@ -49,16 +69,17 @@ class PubMedParser(BaseParser):
             logger.info(f"Searching PubMed for: {query}")
             
             # Step 1: Search for article IDs
-            pmids = self._search_pmids(query, max_results)
+            pmids, history = self._search_pmids(query, max_results)
             if not pmids:
                 logger.warning(f"No results found for query: {query}")
                 return []
             
-            # Step 2: Fetch article details
-            documents = self._fetch_articles(pmids)
-            
-            # Validate documents
-            valid_documents = [doc for doc in documents if self.validate_document(doc)]
+            # Step 2: Fetch and validate article details, paging the server-side
+            # result set for large searches instead of sending the ID list back
+            if history and len(pmids) >= self.history_min_results:
+                valid_documents = self._fetch_articles_from_history(*history, total=len(pmids))
+            else:
+                valid_documents = self._fetch_articles(pmids)
             
             # Cache results
             self.save_to_cache(query, valid_documents)
@@ -71,9 +92,9 @@ class PubMedParser(BaseParser):
             logger.error(f"Error parsing PubMed for query '{query}': {e}")
             return []
     
-    def _search_pmids(self, query: str, max_results: int) -> List[str]:
-        """Search for PubMed IDs using esearch"""
-        self._rate_limit_delay()
+    def _search_pmids(self, query: str, max_results: int) -> Tuple[List[str], Optional[Tuple[str, str]]]:
+        """Search for PubMed IDs using esearch, returning them with the (WebEnv, query_key) history"""
+        self._throttle()
         
         params = {
             'db': 'pubmed',
@@ -82,115 +103,142 @@ class PubMedParser(BaseParser):
             'retmode': 'xml',
             'email': self.email,
             'tool': self.tool,
-            'sort': 'pub+date'  # Sort by publication date
+            'sort': 'pub+date',  # Sort by publication date
+            'usehistory': 'y'  # Keep the result set on the server for paged efetch
         }
         
         if self.api_key:
             params['api_key'] = self.api_key
         
         try:
-            response = requests.get(f"{self.base_url}esearch.fcgi", params=params, timeout=30)
+            response = self.session.get(f"{self.base_url}esearch.fcgi", params=params, timeout=30)
             response.raise_for_status()
             
-            root = ET.fromstring(response.content)
-            pmids = [id_elem.text for id_elem in root.findall('.//Id')]
+            root = LET.fromstring(response.content, XML_PARSER)
+            pmids = [id_elem.text for id_elem in root.findall('IdList/Id')]
+            
+            webenv = root.findtext('WebEnv')
+            query_key = root.findtext('QueryKey')
+            history = (webenv, query_key) if webenv and query_key else None
             
             logger.info(f"Found {len(pmids)} PMIDs for query: {query}")
-            return pmids
+            return pmids, history
         
         except Exception as e:
             logger.error(f"Error searching PubMed: {e}")
-            return []
+            return [], None
     
     def _fetch_articles(self, pmids: List[str]) -> List[ParsedDocument]:
-        """Fetch article details using efetch"""
+        """Fetch article details using efetch, batching PMIDs per request"""
         if not pmids:
             return []
         
-        self._rate_limit_delay()
+        documents = []
+        for start in range(0, len(pmids), self.efetch_batch_size):
+            documents.extend(self._fetch_article_batch(pmids[start:start + self.efetch_batch_size]))
+        
+        return documents
+    
+    def _fetch_articles_from_history(self, webenv: str, query_key: str, total: int) -> List[ParsedDocument]:
+        """Fetch article details from an esearch history set in retstart pages"""
+        documents = []
+        for start in range(0, total, self.efetch_batch_size):
+            documents.extend(self._efetch({
+                'WebEnv': webenv,
+                'query_key': query_key,
+                'retstart': start,
+                'retmax': min(self.efetch_batch_size, total - start)
+            }))
+        
+        return documents
+    
+    def _fetch_article_batch(self, pmids: List[str]) -> List[ParsedDocument]:
+        """Fetch one batch of articles with a single efetch request"""
+        return self._efetch({'id': ','.join(pmids)})
+    
+    def _efetch(self, selection: Dict[str, Any]) -> List[ParsedDocument]:
+        """Run one efetch request for an ID list or history page, keeping valid articles"""
+        self._throttle()
         
         params = {
             'db': 'pubmed',
-            'id': ','.join(pmids),
             'retmode': 'xml',
             'email': self.email,
-            'tool': self.tool
+            'tool': self.tool,
+            **selection
         }
         
         if self.api_key:
             params['api_key'] = self.api_key
         
         try:
-            response = requests.get(f"{self.base_url}efetch.fcgi", params=params, timeout=60)
-            response.raise_for_status()
-            
-            return self._parse_articles_xml(response.content)
+            # POST keeps long ID lists out of the URL, as recommended by NCBI;
+            # the body is parsed as it arrives rather than buffered whole
+            with self.session.post(f"{self.base_url}efetch.fcgi", data=params, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                # Each article is validated as soon as it is parsed, so invalid
+                # ones are dropped without ever being collected
+                return [doc for doc in self._parse_articles_xml(response.raw) if self.validate_document(doc)]
         
         except Exception as e:
             logger.error(f"Error fetching PubMed articles: {e}")
             return []
     
-    def _parse_articles_xml(self, xml_content: bytes) -> List[ParsedDocument]:
-        """Parse XML response from PubMed"""
-        documents = []
+    def _parse_articles_xml(self, xml_content: Union[bytes, BinaryIO]) -> Iterator[ParsedDocument]:
+        """Yield articles from efetch XML bytes or a file-like body, freeing each one once parsed"""
+        source = BytesIO(xml_content) if isinstance(xml_content, (bytes, bytearray)) else xml_content
         
         try:
-            root = ET.fromstring(xml_content)
-            
-            for article in root.findall('.//PubmedArticle'):
+            for _, article in LET.iterparse(source, events=('end',), tag='PubmedArticle', **XML_PARSER_OPTIONS):
                 try:
                     # Extract basic information
-                    pmid = article.find('.//PMID').text
+                    pmid = self._X_PMID(article)[0]
                     
                     # Title
-                    title_elem = article.find('.//ArticleTitle')
-                    title = title_elem.text if title_elem is not None else "No title"
+                    title = self._X_TITLE(article)
+                    title = title[0] if title else "No title"
                     
                     # Abstract
-                    abstract_texts = []
-                    for abstract in article.findall('.//AbstractText'):
-                        if abstract.text:
-                            label = abstract.get('Label', '')
-                            text = f"{label}: {abstract.text}" if label else abstract.text
-                            abstract_texts.append(text)
-                    
-                    content = " ".join(abstract_texts) if abstract_texts else "No abstract available"
+                    sections = [
+                        (abstract.get('Label'), abstract.text)
+                        for abstract in self._X_ABSTRACT(article)
+                        if abstract.text
+                    ]
+                    content = " ".join(
+                        f"{label}: {text}" if label else text for label, text in sections
+                    ) or "No abstract available"
                     
                     # Authors
-                    authors = []
-                    for author_elem in article.findall('.//Author'):
-                        last_name = author_elem.find('LastName')
-                        first_name = author_elem.find('ForeName')
-                        if last_name is not None and first_name is not None:
-                            authors.append(f"{first_name.text} {last_name.text}")
+                    authors = [
+                        f"{author.findtext('ForeName')} {author.findtext('LastName')}"
+                        for author in self._X_AUTHORS(article)
+                    ]
                     
                     # Publication date
                     pub_date = None
-                    date_elem = article.find('.//PubDate')
-                    if date_elem is not None:
-                        year_elem = date_elem.find('Year')
-                        month_elem = date_elem.find('Month')
-                        day_elem = date_elem.find('Day')
+                    date_elem = self._X_PUB_DATE(article)
+                    if date_elem:
+                        year = date_elem[0].findtext('Year')
+                        month = date_elem[0].findtext('Month')
+                        day = date_elem[0].findtext('Day')
                         
-                        if year_elem is not None:
+                        if year is not None:
                             try:
-                                year = int(year_elem.text)
-                                month = self._parse_month(month_elem.text) if month_elem is not None else 1
-                                day = int(day_elem.text) if day_elem is not None else 1
-                                pub_date = datetime(year, month, day)
+                                month_number = self._parse_month(month)
+                                if month_number is None:
+                                    raise ValueError(f"unknown month {month!r}")
+                                pub_date = datetime(int(year), month_number, int(day) if day else 1)
                             except (ValueError, TypeError):
                                 logger.warning(f"Could not parse date for PMID {pmid}")
                     
                     # Journal information
-                    journal_elem = article.find('.//Title')
-                    journal = journal_elem.text if journal_elem is not None else "Unknown journal"
+                    journal = self._X_JOURNAL(article)
+                    journal = journal[0] if journal else "Unknown journal"
                     
                     # DOI
-                    doi = None
-                    for article_id in article.findall('.//ArticleId'):
-                        if article_id.get('IdType') == 'doi':
-                            doi = article_id.text
-                            break
+                    doi = self._X_DOI(article)
+                    doi = doi[0] if doi else None
                     
                     # Create URL
                     url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
@@ -204,7 +252,7 @@ class PubMedParser(BaseParser):
                     }
                     
                     # Create document
-                    document = ParsedDocument(
+                    yield ParsedDocument(
                         title=title,
                         content=content,
                         source=self.name,
@@ -214,34 +262,28 @@ class PubMedParser(BaseParser):
                         document_type="research_article",
                         metadata=metadata
                     )
-                    
-                    documents.append(document)
                 
                 except Exception as e:
                     logger.warning(f"Error parsing individual article: {e}")
-                    continue
+                
+                # Drop the parsed article and its already-processed siblings
+                article.clear(keep_tail=True)
+                while article.getprevious() is not None:
+                    del article.getparent()[0]
         
-        except ET.ParseError as e:
+        except LET.XMLSyntaxError as e:
             logger.error(f"Error parsing PubMed XML: {e}")
-        
-        return documents
     
-    def _parse_month(self, month_str: str) -> int:
-        """Parse month string to number"""
+    def _parse_month(self, month_str: str) -> Optional[int]:
+        """Parse month string to number, or None for an out-of-range month number"""
         if not month_str:
             return 1
         
-        month_map = {
-            'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-            'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-        }
-        
-        try:
-            # Try parsing as number first
-            return int(month_str)
-        except ValueError:
-            # Try parsing as month name
-            return month_map.get(month_str[:3], 1)
+        month = MONTH_MAP.get(month_str) or MONTH_MAP.get(month_str[:3])
+        if month is None and not month_str.isdigit():
+            # Unrecognised names (e.g. seasons) still keep the year
+            return 1
+        return month
     
     def validate_document(self, document: ParsedDocument) -> bool:
         """Validate PubMed document"""
@@ -254,15 +296,7 @@ class PubMedParser(BaseParser):
                 return False
             
             # Check for longevity/aging related content
-            longevity_keywords = [
-                'aging', 'ageing', 'longevity', 'lifespan', 'senescence',
-                'gerontology', 'anti-aging', 'life extension', 'cellular aging',
-                'telomere', 'caloric restriction', 'rapamycin', 'metformin',
-                'centenarian', 'longevity genes', 'aging biomarkers'
-            ]
-            
-            text_lower = (document.title + " " + document.content).lower()
-            if not any(keyword in text_lower for keyword in longevity_keywords):
+            if not LONGEVITY_PATTERN.search(document.text_lower):
                 return False
             
             return True
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test suite for ImmortyX configuration loading
+"""
+
+import json
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import config_loader
+from utils.config_loader import ConfigLoader
+
+class TestLLMSettings(unittest.TestCase):
+    """Test cases for LLM settings read from the environment"""
+    
+    def test_environment_overrides(self):
+        """Test that IMMORTYX_LLM_* variables replace the defaults"""
+        env = {'IMMORTYX_LLM_MODEL': 'test-model', 'IMMORTYX_LLM_MAX_TOKENS': '200', 'IMMORTYX_LLM_TEMPERATURE': '0'}
+        with mock.patch.dict(os.environ, env):
+            settings = config_loader._load_llm_settings()
+        
+        self.assertEqual(settings.model, 'test-model')
+        self.assertEqual(settings.max_tokens, 200)
+        self.assertEqual(settings.temperature, 0.0)
+        self.assertFalse(settings.prewarm)
+    
+    def test_malformed_numbers_fall_back(self):
+        """Test that malformed numeric variables are ignored instead of failing at import"""
+        env = {'IMMORTYX_LLM_MAX_TOKENS': 'lots', 'IMMORTYX_LLM_TEMPERATURE': 'warm', 'IMMORTYX_LLM_MAX_RETRIES': '3.5'}
+        with mock.patch.dict(os.environ, env), self.assertLogs(config_loader.logger, 'WARNING'):
+            settings = config_loader._load_llm_settings()
+        
+        self.assertEqual(settings.max_tokens, 75)
+        self.assertEqual(settings.temperature, 0.5)
+        self.assertEqual(settings.max_retries, 3)
+
+class TestConfigLoader(unittest.TestCase):
+    """Test cases for cached configuration loading"""
+    
+    def setUp(self):
+        """Write a configuration file to a temporary directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'config.json')
+        self.write_config({'research_themes': ['longevity_genetics']})
+        ConfigLoader.clear_cache()
+    
+    def tearDown(self):
+        """Remove the temporary configuration"""
+        ConfigLoader.clear_cache()
+        self.tmp_dir.cleanup()
+    
+    def write_config(self, config):
+        """Write a configuration file"""
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+    
+    def test_reload_on_change(self):
+        """Test that the file is read once and again only after it changes"""
+        first = ConfigLoader.load_config(self.config_path)
+        self.assertEqual(first['research_themes'], ['longevity_genetics'])
+        with mock.patch('builtins.open') as open_file, mock.patch('utils.json_utils.loads') as loads:
+            second = ConfigLoader.load_config(self.config_path)
+            open_file.assert_not_called()
+            loads.assert_not_called()
+        self.assertIs(second, first)
+        
+        self.write_config({'research_themes': ['aging_interventions']})
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        self.assertEqual(ConfigLoader.load_config(self.config_path)['research_themes'], ['aging_interventions'])
+    
+    def test_helpers_return_copies(self):
+        """Test that mutating what the helpers return doesn't change the cached configuration"""
+        self.write_config({'research_themes': ['longevity_genetics'], 'query_templates': {'longevity_genetics': ['FOXO3']}})
+        cached = ConfigLoader.load_config(self.config_path)
+        
+        with mock.patch.object(ConfigLoader, 'load_config', return_value=cached):
+            ConfigLoader.get_research_themes().append('mutated')
+            ConfigLoader.get_query_templates('longevity_genetics').append('mutated')
+            ConfigLoader.get_query_templates()['longevity_genetics'].append('mutated')
+            ConfigLoader.get_source_config()['pubmed'] = {}
+        
+        self.assertEqual(ConfigLoader.load_config(self.config_path), {
+            'research_themes': ['longevity_genetics'],
+            'query_templates': {'longevity_genetics': ['FOXO3']}
+        })
+    
+    def test_missing_and_invalid_files(self):
+        """Test that unreadable configuration yields an empty dict and isn't cached"""
+        self.assertEqual(ConfigLoader.load_config(os.path.join(self.tmp_dir.name, 'missing.json')), {})
+        
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        self.assertEqual(ConfigLoader.load_config(self.config_path), {})
+        
+        self.write_config({'research_themes': []})
+        self.assertEqual(ConfigLoader.load_config(self.config_path), {'research_themes': []})
+
+if __name__ == '__main__':
+    unittest.main()
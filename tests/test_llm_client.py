@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test suite for ImmortyX LLM client
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import llm_client
+from utils.llm_client import LLMClient
+
+def completion(content: str) -> mock.Mock:
+    """Build a chat completion response carrying the given text"""
+    return mock.Mock(choices=[mock.Mock(message=mock.Mock(content=content))])
+
+class TestLLMClient(unittest.TestCase):
+    """Test cases for LLMClient with a mocked OpenAI client"""
+    
+    def setUp(self):
+        """Create a client whose completions are served by a mock"""
+        with mock.patch('utils.llm_client._get_shared_client') as get_shared_client:
+            self.client = LLMClient()
+        self.create = get_shared_client.return_value.chat.completions.create
+        llm_client._responses.clear()
+    
+    def answer(self, batch_reply: str):
+        """Reply to batched prompts with batch_reply and to single prompts with a per-text answer"""
+        def create(messages, **kwargs):
+            if 'JSON array' in messages[0]['content']:
+                return completion(batch_reply)
+            return completion(f"single: {messages[1]['content']}")
+        self.create.side_effect = create
+    
+    def test_batch_json_array(self):
+        """Test that one packed prompt answers every text, even inside a code fence"""
+        self.answer('```json\n["first", "second"]\n```')
+        
+        self.assertEqual(self.client.summarize_batch(["text one", "text two"]), ["first", "second"])
+        self.assertEqual(self.create.call_count, 1)
+    
+    def test_batch_fallback_on_length_mismatch(self):
+        """Test that a reply with the wrong number of answers is retried per text"""
+        self.answer('["only one"]')
+        
+        results = self.client.extract_entities_batch(["text one", "text two"])
+        
+        self.assertEqual(results, ["single: text one", "single: text two"])
+        self.assertEqual(self.create.call_count, 3)
+    
+    def test_batch_fallback_on_invalid_json(self):
+        """Test that an empty reply or one without a parseable array is retried per text"""
+        for reply in ("Here are the summaries: first, second", '["first", second]', '[1, 2]', None):
+            with self.subTest(reply=reply):
+                llm_client._responses.clear()
+                self.answer(reply)
+                self.assertEqual(self.client.summarize_batch(["a", "b"]), ["single: a", "single: b"])
+    
+    def test_batch_chunking(self):
+        """Test that texts are packed into prompts of at most MAX_BATCH_CHARS, keeping input order"""
+        self.answer('["x", "y"]')
+        texts = ["a" * 10, "b" * 10, "c" * 10, "d" * 10, "e" * 10]
+        
+        with mock.patch('utils.llm_client.MAX_BATCH_CHARS', 25):
+            results = self.client.summarize_batch(texts)
+        
+        # Two full prompts, then a lone text that goes through the single-text path
+        self.assertEqual(results, ["x", "y", "x", "y", f"single: {texts[4]}"])
+        self.assertEqual(self.create.call_count, 3)
+    
+    def test_response_cache(self):
+        """Test that identical deterministic requests are answered once"""
+        self.client.temperature = 0
+        self.create.return_value = completion("answer")
+        
+        self.assertEqual(self.client.extract_entities("text one"), "answer")
+        self.assertEqual(self.client.extract_entities("text one"), "answer")
+        self.assertEqual(self.create.call_count, 1)
+        
+        # A different text or a call without use_cache goes to the server
+        self.client.extract_entities("text two")
+        self.client.chat_completion([{"role": "user", "content": "text one"}])
+        self.assertEqual(self.create.call_count, 3)
+    
+    def test_response_cache_requires_zero_temperature(self):
+        """Test that sampled answers are not replayed"""
+        self.client.temperature = 0.5
+        self.create.return_value = completion("answer")
+        
+        self.client.extract_entities("text one")
+        self.client.extract_entities("text one")
+        self.assertEqual(self.create.call_count, 2)
+    
+    def test_response_cache_skips_errors(self):
+        """Test that failed requests are retried rather than cached"""
+        self.client.temperature = 0
+        self.create.side_effect = [RuntimeError("server down"), completion("answer")]
+        
+        self.assertTrue(self.client.extract_entities("text one").startswith("Error generating response"))
+        self.assertEqual(self.client.extract_entities("text one"), "answer")
+        self.assertEqual(self.create.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,16 @@
 Test suite for ImmortyX parsers
 """
 
+import asyncio
+import io
+import json
 import unittest
 import sys
 import os
-from datetime import datetime
+import tempfile
+import time
+from datetime import datetime, timezone
+from unittest import mock
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,7 +20,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from parsers.pubmed_parser import PubMedParser
 from parsers.biorxiv_parser import BioRxivParser
 from parsers.nature_parser import NatureParser
-from parsers.base_parser import ParsedDocument
+from parsers.arxiv_parser import ArxivParser
+from parsers.clinicaltrials_parser import ClinicalTrialsParser
+from parsers.base_parser import ParsedDocument, keyword_pattern
 
 class TestParsers(unittest.TestCase):
     """Test cases for data source parsers"""
@@ -87,6 +95,10 @@ class TestParsers(unittest.TestCase):
             self.assertEqual(doc.source, "nature_aging")
             self.assertGreater(len(doc.title), 5)
             self.assertGreater(len(doc.content), 50)
+        
+        # Each call builds new documents, so metadata edits stay with the caller
+        samples[0].metadata['research_theme'] = 'theme_A'
+        self.assertNotIn('research_theme', NatureParser(self.test_config)._create_default_samples()[0].metadata)
     
     def test_parser_validation(self):
         """Test document validation methods"""
@@ -110,6 +122,82 @@ class TestParsers(unittest.TestCase):
         self.assertTrue(parser.validate_document(valid_doc))
         self.assertFalse(parser.validate_document(invalid_doc))
     
+    def test_clinicaltrials_v2_parsing(self):
+        """Test parsing of ClinicalTrials.gov v2 study records"""
+        parser = ClinicalTrialsParser(self.test_config)
+        
+        payload = {
+            'studies': [{
+                'protocolSection': {
+                    'identificationModule': {
+                        'nctId': 'NCT01234567',
+                        'briefTitle': 'Metformin in aging',
+                        'officialTitle': 'Targeting Aging With Metformin in Older Adults'
+                    },
+                    'descriptionModule': {'briefSummary': 'A trial of metformin in adults aged 65 to 79.'},
+                    'conditionsModule': {'conditions': ['Aging']},
+                    'armsInterventionsModule': {'interventions': [{'name': 'Metformin'}, {'name': 'Placebo'}]},
+                    'designModule': {'studyType': 'INTERVENTIONAL', 'phases': ['PHASE3']},
+                    'statusModule': {
+                        'overallStatus': 'RECRUITING',
+                        'startDateStruct': {'date': '2024-03'},
+                        'completionDateStruct': {'date': '2029-12-31'}
+                    },
+                    'sponsorCollaboratorsModule': {'leadSponsor': {'name': 'Example University'}},
+                    'outcomesModule': {'primaryOutcomes': [{'measure': 'Time to age-related disease'}]}
+                }
+            }]
+        }
+        response = mock.Mock()
+        response.json.return_value = payload
+        response.content = json.dumps(payload).encode()
+        parser.session = mock.Mock()
+        parser.session.get.return_value = response
+        
+        documents = parser._search_trials("metformin", 5)
+        
+        self.assertEqual(len(documents), 1)
+        doc = documents[0]
+        self.assertEqual(doc.title, 'Targeting Aging With Metformin in Older Adults')
+        self.assertEqual(doc.url, 'https://clinicaltrials.gov/study/NCT01234567')
+        self.assertEqual(doc.authors, ['Example University'])
+        self.assertEqual(doc.publication_date, datetime(2024, 3, 1))
+        self.assertIn('Primary Outcome: Time to age-related disease', doc.content)
+        self.assertEqual(doc.metadata['condition'], 'Aging')
+        self.assertEqual(doc.metadata['intervention'], ['Metformin', 'Placebo'])
+        self.assertEqual(doc.metadata['phase'], 'PHASE3')
+        self.assertEqual(doc.metadata['completion_date'], '2029-12-31')
+        self.assertTrue(parser.validate_document(doc))
+        
+        params = parser.session.get.call_args.kwargs['params']
+        self.assertEqual(params['query.term'], 'metformin')
+        self.assertEqual(params['pageSize'], 5)
+    
+    def test_preprint_keyword_validation(self):
+        """Test keyword-based validation in the preprint parsers"""
+        relevant_doc = ParsedDocument(
+            title="Mapping transcriptional drift in old tissues",
+            content="We profile gene expression across tissues and find widespread changes associated with Healthspan decline in mice.",
+            source="test"
+        )
+        unrelated_doc = ParsedDocument(
+            title="Protein folding under thermal load",
+            content="We simulate folding trajectories for small globular proteins at elevated temperatures using coarse-grained models.",
+            source="test"
+        )
+        
+        for parser in (ArxivParser(self.test_config), BioRxivParser(self.test_config)):
+            self.assertTrue(parser.validate_document(relevant_doc))
+            self.assertFalse(parser.validate_document(unrelated_doc))
+    
+    def test_keyword_pattern_pruning(self):
+        """Test that keywords containing a shorter keyword are dropped from any-hit patterns"""
+        pattern = keyword_pattern(('aging', 'cellular aging', 'anti-aging', 'telomere', 'aging'))
+        
+        self.assertEqual(pattern.pattern, 'aging|telomere')
+        self.assertIsNotNone(pattern.search('markers of cellular aging'))
+        self.assertIsNone(pattern.search('mitochondrial function'))
+    
     def test_parser_should_update(self):
         """Test parser update timing logic"""
         parser = NatureParser(self.test_config)
@@ -125,6 +213,35 @@ class TestParsers(unittest.TestCase):
         parser.is_enabled = False
         self.assertFalse(parser.should_update())
     
+    def test_throttle_token_bucket(self):
+        """Test that the token bucket paces requests, allowing a burst only when configured"""
+        strict = NatureParser(dict(self.test_config, rate_limit=50))
+        start = time.monotonic()
+        for _ in range(5):
+            strict._throttle()
+        self.assertGreaterEqual(time.monotonic() - start, 0.07)
+        
+        parser = NatureParser(dict(self.test_config, rate_limit=50, rate_burst=50))
+        
+        start = time.monotonic()
+        for _ in range(50):
+            parser._throttle()
+        burst_elapsed = time.monotonic() - start
+        
+        for _ in range(5):
+            parser._throttle()
+        paced_elapsed = time.monotonic() - start
+        
+        self.assertLess(burst_elapsed, 0.05)
+        self.assertGreaterEqual(paced_elapsed, 0.09)
+        
+        # No limit configured means no waiting
+        unlimited = NatureParser(self.test_config)
+        start = time.monotonic()
+        for _ in range(100):
+            unlimited._throttle()
+        self.assertLess(time.monotonic() - start, 0.05)
+    
     def test_cache_path_generation(self):
         """Test cache path generation"""
         parser = NatureParser(self.test_config)
@@ -135,6 +252,82 @@ class TestParsers(unittest.TestCase):
         self.assertIn(parser.name, cache_path)
         self.assertTrue(cache_path.endswith('.json'))
     
+    def test_cache_round_trip(self):
+        """Test saving and reloading documents through the query cache"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parser = NatureParser({
+                'use_cache': True,
+                'cache_dir': tmp_dir,
+                'sample_data_dir': tmp_dir
+            })
+            
+            documents = parser._create_default_samples()
+            parser.save_to_cache("aging research", documents)
+            cached = parser.load_from_cache("aging research")
+            
+            self.assertEqual(len(cached), len(documents))
+            for original, loaded in zip(documents, cached):
+                self.assertEqual(loaded.document_id, original.document_id)
+                self.assertEqual(loaded.title, original.title)
+                self.assertEqual(loaded.authors, original.authors)
+                self.assertEqual(loaded.publication_date, original.publication_date)
+                self.assertEqual(loaded.parsed_date, original.parsed_date)
+                self.assertEqual(loaded.metadata, original.metadata)
+            
+            self.assertIsNone(parser.load_from_cache("unrelated query"))
+    
+    def test_memory_cache_layer(self):
+        """Test the in-memory layer over the file cache"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parser = NatureParser({
+                'use_cache': True,
+                'cache_dir': tmp_dir,
+                'sample_data_dir': tmp_dir,
+                'memory_cache_size': 1
+            })
+            
+            documents = parser._create_default_samples()
+            parser.save_to_cache("aging research", documents)
+            os.remove(parser.get_cache_path("aging research"))
+            
+            # Served from memory, and edits to returned documents don't leak back
+            cached = parser.load_from_cache("aging research")
+            self.assertEqual(len(cached), len(documents))
+            cached[0].metadata['entities'] = {'genes': ['SIRT1']}
+            self.assertNotIn('entities', parser.load_from_cache("aging research")[0].metadata)
+            
+            # Expired entries and least recently used entries are not returned
+            self.assertIsNone(parser.load_from_cache("aging research", max_age=-1))
+            parser.save_to_cache("senescence", documents[:1])
+            os.remove(parser.get_cache_path("senescence"))
+            self.assertIsNone(parser.load_from_cache("aging research"))
+    
+    def test_sample_data_reload_on_change(self):
+        """Test that decoded sample data is reused until the file changes"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parser = NatureParser(dict(self.test_config, cache_dir=tmp_dir, sample_data_dir=tmp_dir))
+            sample_path = os.path.join(tmp_dir, parser.sample_file)
+            
+            samples = [doc.to_dict() for doc in parser._create_default_samples()]
+            with open(sample_path, 'w', encoding='utf-8') as f:
+                json.dump(samples, f)
+            
+            first = parser.load_sample_data(parser.sample_file)
+            first[0].metadata['entities'] = {'genes': ['FOXO3']}
+            with mock.patch('utils.json_utils.loads') as loads:
+                second = parser.load_sample_data(parser.sample_file)
+                loads.assert_not_called()
+            
+            self.assertEqual([doc.title for doc in second], [doc.title for doc in first])
+            self.assertNotIn('entities', second[0].metadata)
+            
+            with open(sample_path, 'w', encoding='utf-8') as f:
+                json.dump(samples[:1], f)
+            stat = os.stat(sample_path)
+            os.utime(sample_path, (stat.st_atime, stat.st_mtime + 10))
+            
+            self.assertEqual(len(parser.load_sample_data(parser.sample_file)), 1)
+    
     def test_parser_status(self):
         """Test parser status reporting"""
         parser = NatureParser(self.test_config)
@@ -146,6 +339,153 @@ class TestParsers(unittest.TestCase):
         self.assertIn('should_update', status)
         self.assertEqual(status['name'], parser.name)
 
+    def test_arxiv_feed_parsing(self):
+        """Test arXiv Atom feed parsing"""
+        parser = ArxivParser(self.test_config)
+        
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <published>2024-01-02T10:00:00Z</published>
+    <title> Senescence dynamics in aging tissues </title>
+    <summary> A model of cellular senescence. </summary>
+    <author><name>Jane Doe</name></author>
+    <author><name>John Roe</name></author>
+    <arxiv:doi>10.1000/example</arxiv:doi>
+    <category term="q-bio.CB"/>
+    <category term="q-bio.TO"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00002v1</id>
+    <title>Second entry</title>
+    <summary>Another abstract</summary>
+  </entry>
+</feed>"""
+        
+        documents = parser._parse_feed(feed)
+        
+        self.assertEqual(len(documents), 2)
+        doc = documents[0]
+        self.assertEqual(doc.title, "Senescence dynamics in aging tissues")
+        self.assertEqual(doc.content, "A model of cellular senescence.")
+        self.assertEqual(doc.authors, ["Jane Doe", "John Roe"])
+        self.assertEqual(doc.publication_date, datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc))
+        self.assertEqual(doc.metadata['arxiv_id'], "2401.00001v1")
+        self.assertEqual(doc.metadata['categories'], ["q-bio.CB", "q-bio.TO"])
+        self.assertEqual(doc.metadata['doi'], "10.1000/example")
+        self.assertEqual(documents[1].authors, [])
+        self.assertIsNone(documents[1].metadata['doi'])
+    
+    def test_pubmed_article_parsing(self):
+        """Test PubMed efetch XML parsing"""
+        parser = PubMedParser(self.test_config)
+        
+        xml_content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">12345</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue>
+            <PubDate><Year>2023</Year><Month>Mar</Month><Day>7</Day></PubDate>
+          </JournalIssue>
+          <Title>Aging Cell</Title>
+        </Journal>
+        <ArticleTitle>Rapamycin extends lifespan in mice</ArticleTitle>
+        <Abstract>
+          <AbstractText Label="BACKGROUND">Aging is a risk factor.</AbstractText>
+          <AbstractText>Treatment extended lifespan.</AbstractText>
+        </Abstract>
+        <AuthorList>
+          <Author><LastName>Doe</LastName><ForeName>Jane</ForeName></Author>
+          <Author><CollectiveName>Aging Consortium</CollectiveName></Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+    <PubmedData>
+      <ArticleIdList>
+        <ArticleId IdType="pubmed">12345</ArticleId>
+        <ArticleId IdType="doi">10.1000/aging.1</ArticleId>
+      </ArticleIdList>
+    </PubmedData>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">67890</PMID>
+      <Article>
+        <Journal><Title>Geroscience</Title></Journal>
+        <ArticleTitle>Second article</ArticleTitle>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>"""
+        
+        documents = list(parser._parse_articles_xml(xml_content))
+        
+        self.assertEqual(len(documents), 2)
+        doc = documents[0]
+        self.assertEqual(doc.title, "Rapamycin extends lifespan in mice")
+        self.assertEqual(doc.content, "BACKGROUND: Aging is a risk factor. Treatment extended lifespan.")
+        self.assertEqual(doc.authors, ["Jane Doe"])
+        self.assertEqual(doc.publication_date, datetime(2023, 3, 7))
+        self.assertEqual(doc.url, "https://pubmed.ncbi.nlm.nih.gov/12345/")
+        self.assertEqual(doc.metadata['journal'], "Aging Cell")
+        self.assertEqual(doc.metadata['doi'], "10.1000/aging.1")
+        self.assertEqual(documents[1].content, "No abstract available")
+        self.assertIsNone(documents[1].metadata['doi'])
+        
+        # Month tokens: names, plain and zero-padded numbers; anything else is rejected
+        self.assertEqual(parser._parse_month("Sep"), 9)
+        self.assertEqual(parser._parse_month("September"), 9)
+        self.assertEqual(parser._parse_month("07"), 7)
+        self.assertEqual(parser._parse_month("12"), 12)
+        self.assertEqual(parser._parse_month(None), 1)
+        self.assertEqual(parser._parse_month("Spring"), 1)
+        self.assertIsNone(parser._parse_month("13"))
+        
+        # An unknown name keeps the year; an invalid month number leaves the date unparsed
+        article = b"""<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>1</PMID><Article>
+          <Journal><JournalIssue><PubDate><Year>2021</Year><Month>%s</Month></PubDate></JournalIssue></Journal>
+          <ArticleTitle>Aging study</ArticleTitle></Article></MedlineCitation></PubmedArticle></PubmedArticleSet>"""
+        [seasonal] = parser._parse_articles_xml(article % b"Spring")
+        self.assertEqual(seasonal.publication_date, datetime(2021, 1, 1))
+        with self.assertLogs('parsers.pubmed_parser', 'WARNING'):
+            [invalid] = parser._parse_articles_xml(article % b"13")
+        self.assertNotEqual(invalid.publication_date.year, 2021)
+    
+    def test_pubmed_history_fetch(self):
+        """Test that large PubMed searches are fetched through the esearch history"""
+        parser = PubMedParser({**self.test_config, 'rate_limit': 1000, 'efetch_batch_size': 40})
+        
+        ids = ''.join(f"<Id>{pmid}</Id>" for pmid in range(60))
+        search_response = mock.Mock()
+        search_response.content = (
+            f"<eSearchResult><Count>500</Count><IdList>{ids}</IdList>"
+            f"<QueryKey>1</QueryKey><WebEnv>MCID_abc</WebEnv></eSearchResult>"
+        ).encode()
+        
+        def fetch_response(*args, **kwargs):
+            response = mock.MagicMock()
+            response.__enter__.return_value = response
+            response.raw = io.BytesIO(b"<PubmedArticleSet/>")
+            return response
+        
+        parser.session = mock.Mock()
+        parser.session.get.return_value = search_response
+        parser.session.post.side_effect = fetch_response
+        
+        parser.parse("rapamycin", max_results=60)
+        
+        self.assertEqual(parser.session.get.call_args.kwargs['params']['usehistory'], 'y')
+        pages = [call.kwargs['data'] for call in parser.session.post.call_args_list]
+        self.assertEqual([(page['retstart'], page['retmax']) for page in pages], [(0, 40), (40, 20)])
+        self.assertTrue(all(page['WebEnv'] == 'MCID_abc' and page['query_key'] == '1' for page in pages))
+        self.assertNotIn('id', pages[0])
+        self.assertTrue(parser.session.post.call_args.kwargs['stream'])
+
 class TestParserIntegration(unittest.TestCase):
     """Integration tests for parsers"""
     
@@ -171,6 +511,81 @@ class TestParserIntegration(unittest.TestCase):
         filtered_docs = parser._filter_by_query(all_docs, "quantum physics")
         self.assertEqual(len(filtered_docs), 0)
     
+    def test_async_parse_matches_sync(self):
+        """Test that aparse returns the same documents as parse"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = dict(self.test_config, cache_dir=tmp_dir, sample_data_dir=tmp_dir)
+            parsers = [NatureParser(config), NatureParser(config)]
+            
+            async def run_all():
+                return await asyncio.gather(*(parser.aparse("senescence", 5) for parser in parsers))
+            
+            results = asyncio.run(run_all())
+            expected = [doc.document_id for doc in parsers[0].parse("senescence", 5)]
+            
+            self.assertGreater(len(expected), 0)
+            for documents in results:
+                self.assertEqual([doc.document_id for doc in documents], expected)
+    
+    def test_biorxiv_query_filtering(self):
+        """Test query filtering and ranking in bioRxiv parser"""
+        parser = BioRxivParser(self.test_config)
+        
+        one_hit = ParsedDocument(title="Autophagy in yeast", content="Autophagy flux declines with age.", source="biorxiv", url="a")
+        two_hits = ParsedDocument(title="Autophagy and senescence", content="Senescence, autophagy and NAD+.", source="biorxiv", url="b")
+        no_hit = ParsedDocument(title="Autophagic vesicles", content="Vesicle trafficking in neurons.", source="biorxiv", url="c")
+        
+        filtered = parser._filter_by_query([one_hit, two_hits, no_hit], "Autophagy senescence")
+        
+        self.assertEqual(filtered, [two_hits, one_hit])
+        
+        # Query words match inside longer words, e.g. plurals
+        plural = ParsedDocument(title="Telomeres in stem cells", content="Telomere attrition.", source="biorxiv", url="d")
+        self.assertEqual(parser._filter_by_query([no_hit, plural], "telomere"), [plural])
+        self.assertEqual(parser._filter_by_query([no_hit], ""), [no_hit])
+    
+    def test_stub_parse_memoization(self):
+        """Test that stub parsers memoize results for repeated queries"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parser = NatureParser({'use_cache': True, 'cache_dir': tmp_dir, 'sample_data_dir': tmp_dir})
+            
+            first = parser.parse("senescence", 5)
+            first[0].metadata['research_theme'] = 'theme_A'
+            with mock.patch.object(parser, 'load_sample_data') as load_sample_data:
+                second = parser.parse(" Senescence ", 5)
+                load_sample_data.assert_not_called()
+            
+            # Hits are rebuilt, so edits to earlier results don't leak into them
+            self.assertEqual([doc.document_id for doc in second], [doc.document_id for doc in first])
+            self.assertIsNot(second[0], first[0])
+            self.assertNotIn('research_theme', second[0].metadata)
+            self.assertFalse(parser.should_update())
+            
+            # Writing the sample file invalidates memoized results
+            sample_path = os.path.join(tmp_dir, parser.sample_file)
+            with open(sample_path, 'w', encoding='utf-8') as f:
+                json.dump([doc.to_dict() for doc in second[:1]], f)
+            self.assertEqual(len(parser.parse("senescence", 5)), 1)
+            
+            # Nothing is memoized with caching disabled
+            uncached = NatureParser(dict(self.test_config, cache_dir=tmp_dir, sample_data_dir=tmp_dir))
+            uncached.parse("senescence", 5)
+            with mock.patch.object(uncached, 'load_sample_data', return_value=[]) as load_sample_data:
+                uncached.parse("senescence", 5)
+                load_sample_data.assert_called_once()
+    
+    def test_parse_many(self):
+        """Test running several queries through one parser"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parser = NatureParser(dict(self.test_config, cache_dir=tmp_dir, sample_data_dir=tmp_dir))
+            
+            results = parser.parse_many(["senescence", "mitochondrial", "senescence", "quantum physics"], 5)
+            
+            self.assertEqual(list(results), ["senescence", "mitochondrial", "quantum physics"])
+            self.assertGreater(len(results["senescence"]), 0)
+            self.assertGreater(len(results["mitochondrial"]), 0)
+            self.assertEqual(results["quantum physics"], [])
+    
     def test_multiple_parser_consistency(self):
         """Test consistency across different parsers"""
         parsers = [
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test suite for ImmortyX text processing utilities
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.text_processing import TextProcessor
+
+class TestTextProcessor(unittest.TestCase):
+    """Test cases for TextProcessor"""
+    
+    def test_clean_text(self):
+        """Test whitespace collapsing and special character removal"""
+        self.assertEqual(TextProcessor.clean_text("  Aging\t\n cells™ (mice)!  "), "Aging cells (mice)!")
+        self.assertEqual(TextProcessor.clean_text(""), "")
+    
+    def test_extract_keywords(self):
+        """Test keyword frequency ranking with stop words removed"""
+        text = "Senescent cells drive aging. Clearing senescent cells with senolytics delays aging in mice."
+        keywords = TextProcessor.extract_keywords(text, max_keywords=3)
+        
+        self.assertEqual(keywords, ['senescent', 'cells', 'aging'])
+        self.assertNotIn('with', TextProcessor.extract_keywords(text))
+        self.assertEqual(TextProcessor.extract_keywords("mice rats aging", min_length=5), ['aging'])
+        self.assertEqual(TextProcessor.extract_keywords("Aging AGING aging"), ['aging'])
+    
+    def test_extract_sentences(self):
+        """Test sentence splitting"""
+        sentences = TextProcessor.extract_sentences("First finding. Second finding!  Is it third?")
+        
+        self.assertEqual(sentences, ["First finding", "Second finding", "Is it third"])
+        self.assertEqual(TextProcessor.extract_sentences(""), [])
+        self.assertEqual(list(TextProcessor.iter_sentences("No terminal punctuation")), ["No terminal punctuation"])
+    
+    def test_find_citations(self):
+        """Test citation pattern detection"""
+        text = "As shown (Smith 2020) and in [12], see doi: 10.1000/182 and PMID: 12345678."
+        citations = TextProcessor.find_citations(text)
+        
+        self.assertEqual(citations, ["Smith 2020", "12", "10.1000/182", "12345678"])
+        
+        # Grouped by form, and overlapping matches are all kept
+        self.assertEqual(
+            TextProcessor.find_citations("PMID: 12345 (Smith 2019) doi: 10.1/x [4]"),
+            ["Smith 2019", "4", "10.1/x", "12345"]
+        )
+        self.assertEqual(
+            TextProcessor.find_citations("See (doi: 10.1000/2020) and [3]."),
+            ["doi: 10.1000/2020", "3", "10.1000/2020)"]
+        )
+    
+    def test_extract_authors(self):
+        """Test author name extraction"""
+        authors = TextProcessor.extract_authors("Lopez et al. reviewed the hallmarks; Smith, J. A. agreed.")
+        
+        self.assertEqual(authors, ["Lopez", "Smith, J. A."])
+        self.assertEqual(TextProcessor.extract_authors("Jane Doe met Jane Doe."), ["Jane Doe"])
+        
+        # Names found inside a longer match are reported too
+        self.assertEqual(TextProcessor.extract_authors("Jane Doe Smith et al. reported"), ["Jane Doe Smith", "Jane Doe"])
+    
+    def test_readability_score(self):
+        """Test readability score bounds"""
+        score = TextProcessor.calculate_readability_score("Cells age. Mice live long.")
+        
+        self.assertGreater(score, 0)
+        self.assertLessEqual(score, 100)
+        self.assertEqual(TextProcessor.calculate_readability_score(""), 0.0)
+    
+    def test_detect_language(self):
+        """Test English/Russian detection"""
+        self.assertEqual(TextProcessor.detect_language("Aging research"), "english")
+        self.assertEqual(TextProcessor.detect_language("Исследование старения"), "russian")
+        self.assertEqual(TextProcessor.detect_language("12345"), "unknown")
+
+if __name__ == '__main__':
+    unittest.main()
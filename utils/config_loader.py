@@ -3,43 +3,107 @@
 Configuration loader for ImmortyX system
 """
 
+import copy
 import json
 import os
 import logging
-from typing import Dict, Any
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, Any, Tuple
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class LLMSettings:
+    """LLM endpoint settings, read from the environment once at import"""
+    base_url: str
+    api_key: str
+    model: str
+    max_tokens: int
+    temperature: float
+    max_retries: int  # SDK retries with exponential backoff and jitter on connection errors, 429 and 5xx
+    prewarm: bool  # Open a connection in the background when the client is created (off by default)
+
+def _env_number(name: str, default, cast):
+    """Read a numeric environment variable, falling back to the default if it is malformed"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+def _load_llm_settings() -> LLMSettings:
+    """Build the LLM settings from IMMORTYX_LLM_* environment variables"""
+    return LLMSettings(
+        base_url=os.getenv('IMMORTYX_LLM_URL', 'http://80.209.242.40:8000/v1'),
+        api_key=os.getenv('IMMORTYX_LLM_KEY', 'dummy-key'),
+        model=os.getenv('IMMORTYX_LLM_MODEL', 'llama-3.3-70b-instruct'),
+        max_tokens=_env_number('IMMORTYX_LLM_MAX_TOKENS', 75, int),
+        temperature=_env_number('IMMORTYX_LLM_TEMPERATURE', 0.5, float),
+        max_retries=_env_number('IMMORTYX_LLM_MAX_RETRIES', 3, int),
+        prewarm=os.getenv('IMMORTYX_LLM_PREWARM', '0') not in ('0', 'false', 'False', '')
+    )
+
+LLM_SETTINGS = _load_llm_settings()
+
+# Parsed configuration files by path, with the mtime they were parsed at
+_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_config_cache_lock = threading.Lock()
+
+def _read_config(config_path: str) -> Dict[str, Any]:
+    """Parse a configuration file, reusing the last parse until the file changes (errors are not cached)"""
+    mtime = os.stat(config_path).st_mtime_ns
+    with _config_cache_lock:
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(config_path, 'rb') as f:
+            config = json_utils.loads(f.read())
+        _config_cache[config_path] = (mtime, config)
+    
+    logger.info(f"Configuration loaded from {config_path}")
+    return config
+
 class ConfigLoader:
     """Load and manage system configuration"""
     
     @staticmethod
     def load_config(config_path: str = None) -> Dict[str, Any]:
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file (the returned dict is cached and must not be modified)"""
         if config_path is None:
             # Default to longevity_config.json in the root directory
             config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'longevity_config.json')
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            logger.info(f"Configuration loaded from {config_path}")
-            return config
+            # Shared with other callers until the file changes, so treat it as read-only
+            return _read_config(os.path.abspath(config_path))
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_path}")
             return {}
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses this one
             logger.error(f"Invalid JSON in configuration file: {e}")
             return {}
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             return {}
     
+    @staticmethod
+    def clear_cache():
+        """Forget cached configuration files so the next load reads them again"""
+        with _config_cache_lock:
+            _config_cache.clear()
+    
     @staticmethod
     def get_research_themes() -> list:
         """Get list of research themes"""
         config = ConfigLoader.load_config()
-        return config.get('research_themes', [])
+        return list(config.get('research_themes', []))
     
     @staticmethod
     def get_query_templates(theme: str = None) -> Dict[str, list]:
@@ -48,22 +112,16 @@ class ConfigLoader:
         templates = config.get('query_templates', {})
         
         if theme:
-            return templates.get(theme, [])
-        return templates
+            return list(templates.get(theme, []))
+        return {name: list(queries) for name, queries in templates.items()}
     
     @staticmethod
     def get_source_config() -> Dict[str, Any]:
         """Get data source configuration"""
         config = ConfigLoader.load_config()
-        return config.get('sources', {})
+        return copy.deepcopy(config.get('sources', {}))
     
     @staticmethod
     def get_llm_config() -> Dict[str, Any]:
         """Get LLM configuration"""
-        return {
-            'base_url': 'http://80.209.242.40:8000/v1',
-            'api_key': 'dummy-key',
-            'model': 'llama-3.3-70b-instruct',
-            'max_tokens': 75,
-            'temperature': 0.5
-        }
+        return asdict(LLM_SETTINGS)
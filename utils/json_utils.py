@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+JSON helpers for ImmortyX system
+Uses orjson when it is installed and falls back to the standard library
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
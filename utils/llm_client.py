@@ -4,13 +4,51 @@ LLM Client for ImmortyX system
 Wrapper for OpenAI API client to interact with Llama server
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
+from utils import json_utils
 from utils.config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
+# Rough input budget per batched prompt (~3000 tokens) so latency stays flat
+MAX_BATCH_CHARS = 12000
+
+# Completions of the analysis prompts at temperature 0, keyed by a digest of the
+# full request; the same abstract is routinely re-analysed across collection cycles
+RESPONSE_CACHE_SIZE = 1024
+_responses: 'OrderedDict[bytes, str]' = OrderedDict()
+_responses_lock = threading.Lock()
+
+# One OpenAI client per endpoint for the whole process, so every agent's
+# LLMClient shares the same keep-alive connection pool
+_clients: Dict[Tuple[str, str], OpenAI] = {}
+_clients_lock = threading.Lock()
+
+def _get_shared_client(base_url: str, api_key: str, max_retries: int = 2, prewarm: bool = False) -> OpenAI:
+    """Return the process-wide OpenAI client for an endpoint, creating it on first use"""
+    key = (base_url, api_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OpenAI(base_url=base_url, api_key=api_key, max_retries=max_retries)
+            if prewarm:
+                threading.Thread(target=_prewarm, args=(client,), name="llm-prewarm", daemon=True).start()
+        return client
+
+def _prewarm(client: OpenAI):
+    """Open a pooled connection with a cheap request so the first completion skips the handshake"""
+    try:
+        client.models.list()
+        logger.debug("LLM connection pre-warmed")
+    except Exception as e:
+        logger.debug(f"LLM pre-warm failed: {e}")
+
 class LLMClient:
     """Client for interacting with the LLM server"""
     
@@ -18,10 +56,12 @@ class LLMClient:
         """Initialize the LLM client"""
         try:
             config = ConfigLoader.get_llm_config()
-            self.client = OpenAI(
-                base_url=config['base_url'],
-                api_key=config['api_key']
+            self.client = _get_shared_client(
+                config['base_url'], config['api_key'], config['max_retries'], config.get('prewarm', False)
             )
+            self.base_url = config['base_url']
+            self.api_key = config['api_key']
+            self.max_retries = config['max_retries']
             self.model = config['model']
             self.max_tokens = config['max_tokens']
             self.temperature = config['temperature']
@@ -30,30 +70,101 @@ class LLMClient:
             logger.error(f"Failed to initialize LLM client: {e}")
             self.client = None
     
-    def chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
-        """Generate chat completion"""
+    def chat_completion(self, messages: List[Dict[str, str]], use_cache: bool = False, **kwargs) -> str:
+        """Generate chat completion, optionally reusing an identical earlier request's answer at temperature 0"""
         if not self.client:
             return "LLM client not available"
         
+        params = self._completion_params(messages, kwargs)
+        # Sampled answers differ between calls, so only deterministic requests are replayed
+        use_cache = use_cache and params['temperature'] == 0
+        if use_cache:
+            key = hashlib.blake2b(json_utils.dumps(params), digest_size=16).digest()
+            with _responses_lock:
+                content = _responses.get(key)
+                if content is not None:
+                    _responses.move_to_end(key)
+                    return content
+        
         try:
-            # Override default parameters with kwargs
-            params = {
-                'model': kwargs.get('model', self.model),
-                'messages': messages,
-                'max_tokens': kwargs.get('max_tokens', self.max_tokens),
-                'temperature': kwargs.get('temperature', self.temperature)
-            }
-            
             response = self.client.chat.completions.create(**params)
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            
+            # Only successful answers are cached, so errors are retried next time
+            if use_cache and content is not None:
+                with _responses_lock:
+                    _responses[key] = content
+                    if len(_responses) > RESPONSE_CACHE_SIZE:
+                        _responses.popitem(last=False)
+            return content
             
         except Exception as e:
             logger.error(f"LLM completion error: {e}")
             return f"Error generating response: {str(e)}"
     
+    def chat_completion_stream(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        """Yield completion text as it is generated; ''.join() gives the chat_completion result"""
+        if not self.client:
+            yield "LLM client not available"
+            return
+        
+        try:
+            stream = self.client.chat.completions.create(**self._completion_params(messages, kwargs), stream=True)
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            logger.error(f"LLM streaming error: {e}")
+            yield f"Error generating response: {str(e)}"
+    
+    def _completion_params(self, messages: List[Dict[str, str]], overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Build completion request parameters, letting overrides replace the defaults"""
+        return {
+            'model': overrides.get('model', self.model),
+            'messages': messages,
+            'max_tokens': overrides.get('max_tokens', self.max_tokens),
+            'temperature': overrides.get('temperature', self.temperature)
+        }
+    
+    async def abatch_chat_completion(self, conversations: List[List[Dict[str, str]]],
+                                     max_concurrency: int = 10, **kwargs) -> List[str]:
+        """Generate completions for many conversations with at most max_concurrency in flight"""
+        if not self.client:
+            return ["LLM client not available"] * len(conversations)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # The async client's pool is tied to the running event loop, so it lives
+        # for one batch rather than being shared like the sync client
+        async with AsyncOpenAI(base_url=self.base_url, api_key=self.api_key, max_retries=self.max_retries) as aclient:
+            async def complete(messages: List[Dict[str, str]]) -> str:
+                async with semaphore:
+                    try:
+                        response = await aclient.chat.completions.create(**self._completion_params(messages, kwargs))
+                        return response.choices[0].message.content
+                    except Exception as e:
+                        logger.error(f"LLM completion error: {e}")
+                        return f"Error generating response: {str(e)}"
+            
+            return await asyncio.gather(*(complete(messages) for messages in conversations))
+    
+    def batch_chat_completion(self, conversations: List[List[Dict[str, str]]],
+                              max_concurrency: int = 10, **kwargs) -> List[str]:
+        """Synchronous wrapper around abatch_chat_completion"""
+        return asyncio.run(self.abatch_chat_completion(conversations, max_concurrency, **kwargs))
+    
     def summarize_text(self, text: str, max_length: int = 200) -> str:
         """Summarize a piece of text"""
-        messages = [
+        return self.chat_completion(self._summary_messages(text, max_length), use_cache=True, max_tokens=max_length)
+    
+    def summarize_text_stream(self, text: str, max_length: int = 200) -> Iterator[str]:
+        """Summarize a piece of text, yielding the summary as it is generated"""
+        return self.chat_completion_stream(self._summary_messages(text, max_length), max_tokens=max_length)
+    
+    def _summary_messages(self, text: str, max_length: int) -> List[Dict[str, str]]:
+        """Build the summarization prompt"""
+        return [
             {
                 "role": "system",
                 "content": f"Summarize the following text in no more than {max_length} words, focusing on key insights related to longevity and aging research."
@@ -63,8 +174,70 @@ class LLMClient:
                 "content": text
             }
         ]
+    
+    def summarize_batch(self, texts: List[str], max_length: int = 200) -> List[str]:
+        """Summarize several texts per request, one summary per text in input order"""
+        instruction = (
+            f"Summarize each numbered text in no more than {max_length} words, focusing on key insights "
+            f"related to longevity and aging research."
+        )
+        return self._complete_batch(texts, instruction, max_length, lambda text: self.summarize_text(text, max_length))
+    
+    def extract_entities_batch(self, texts: List[str]) -> List[str]:
+        """Extract entities from several texts per request, one structured list per text in input order"""
+        instruction = (
+            "For each numbered text, extract and list the following entities: genes, proteins, drugs, "
+            "companies, researchers, methods, and key concepts. Format each item as a structured list."
+        )
+        return self._complete_batch(texts, instruction, 300, self.extract_entities)
+    
+    def _complete_batch(self, texts: List[str], instruction: str, tokens_per_item: int,
+                        fallback: Callable[[str], str]) -> List[str]:
+        """Pack texts into as few prompts as fit MAX_BATCH_CHARS, asking for a JSON array of answers"""
+        results = []
+        chunk, chunk_chars = [], 0
+        for text in texts:
+            if chunk and chunk_chars + len(text) > MAX_BATCH_CHARS:
+                results.extend(self._complete_chunk(chunk, instruction, tokens_per_item, fallback))
+                chunk, chunk_chars = [], 0
+            chunk.append(text)
+            chunk_chars += len(text)
+        
+        if chunk:
+            results.extend(self._complete_chunk(chunk, instruction, tokens_per_item, fallback))
+        return results
+    
+    def _complete_chunk(self, texts: List[str], instruction: str, tokens_per_item: int,
+                        fallback: Callable[[str], str]) -> List[str]:
+        """Answer one packed prompt, falling back to per-text calls if the reply is unusable"""
+        if len(texts) == 1:
+            return [fallback(texts[0])]
+        
+        messages = [
+            {
+                "role": "system",
+                "content": f"{instruction} Respond only with a JSON array of {len(texts)} strings, one per text, in order."
+            },
+            {
+                "role": "user",
+                "content": "\n\n".join(f"[{i}] {text}" for i, text in enumerate(texts, 1))
+            }
+        ]
+        
+        response = self.chat_completion(messages, max_tokens=int(len(texts) * tokens_per_item * 1.3))
+        
+        # An empty reply comes back as None
+        if isinstance(response, str):
+            try:
+                # Tolerate prose or code fences around the array
+                answers = json_utils.loads(response[response.index('['):response.rindex(']') + 1])
+                if isinstance(answers, list) and len(answers) == len(texts) and all(isinstance(a, str) for a in answers):
+                    return answers
+            except ValueError:
+                pass
         
-        return self.chat_completion(messages, max_tokens=max_length)
+        logger.warning(f"Batched LLM response was not a {len(texts)}-item JSON array; retrying per text")
+        return [fallback(text) for text in texts]
     
     def extract_entities(self, text: str) -> str:
         """Extract named entities from text"""
@@ -79,7 +252,7 @@ class LLMClient:
             }
         ]
         
-        return self.chat_completion(messages, max_tokens=300)
+        return self.chat_completion(messages, use_cache=True, max_tokens=300)
     
     def assess_scientific_quality(self, text: str) -> str:
         """Assess the scientific quality and reliability of content"""
@@ -94,7 +267,7 @@ class LLMClient:
             }
         ]
         
-        return self.chat_completion(messages, max_tokens=200)
+        return self.chat_completion(messages, use_cache=True, max_tokens=200)
     
     def detect_pseudoscience(self, text: str) -> str:
         """Detect potential pseudoscience indicators"""
@@ -109,7 +282,7 @@ class LLMClient:
             }
         ]
         
-        return self.chat_completion(messages, max_tokens=150)
+        return self.chat_completion(messages, use_cache=True, max_tokens=150)
     
     def is_available(self) -> bool:
         """Check if LLM client is available"""
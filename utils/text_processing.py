@@ -5,11 +5,47 @@ Text processing utilities for ImmortyX system
 
 import re
 import logging
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import Iterator, List, Dict, Tuple, Optional
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.,!?;:()\-]+')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+
+# Deletion tables for str.translate: the length drop is the letter count
+CYRILLIC_LETTERS = dict.fromkeys([*range(ord('а'), ord('я') + 1), ord('ё')])
+LATIN_LETTERS = dict.fromkeys(range(ord('a'), ord('z') + 1))
+
+CITATION_PATTERNS = (
+    re.compile(r'\(([^)]*\d{4}[^)]*)\)'),  # (Author 2023)
+    re.compile(r'\[(\d+)\]'),              # [1]
+    re.compile(r'doi:\s*([^\s]+)'),        # doi: 10.1000/182
+    re.compile(r'PMID:\s*(\d+)'),          # PMID: 12345678
+)
+
+AUTHOR_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+et\s+al\.?'),  # Smith et al.
+    re.compile(r'([A-Z][a-z]+,\s+[A-Z]\.(?:\s+[A-Z]\.)*)'),       # Smith, J. A.
+    re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+)'),                   # John Smith
+)
+
+# Common stop words to filter out of keyword counts
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her',
+    'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its',
+    'may', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'man',
+    'end', 'few', 'got', 'let', 'put', 'say', 'she', 'too', 'use', 'been', 'from',
+    'have', 'here', 'they', 'will', 'with', 'this', 'that', 'what', 'when', 'where',
+    'were', 'said', 'each', 'make', 'most', 'over', 'such', 'very', 'well', 'work'
+})
+
+@lru_cache(maxsize=8)
+def _keyword_pattern(min_length: int) -> re.Pattern:
+    """Compiled word pattern for a minimum keyword length"""
+    return re.compile(rf'\b[a-zA-Z]{{{min_length},}}\b')
+
 class TextProcessor:
     """Utilities for text processing and analysis"""
     
@@ -19,33 +55,22 @@ class TextProcessor:
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.,!?;:()\-]', '', text)
+        text = SPECIAL_CHARS_PATTERN.sub('', text)
         
-        return text.strip()
+        # Collapse whitespace (split/join also trims both ends)
+        return ' '.join(text.split())
     
     @staticmethod
     def extract_keywords(text: str, min_length: int = 3, max_keywords: int = 20) -> List[str]:
         """Extract keywords from text"""
         # Simple keyword extraction - can be enhanced with NLP libraries
-        words = re.findall(r'\b[a-zA-Z]{' + str(min_length) + ',}\b', text.lower())
-        
-        # Common stop words to filter out
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 
-            'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its',
-            'may', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'man',
-            'end', 'few', 'got', 'let', 'put', 'say', 'she', 'too', 'use', 'been', 'from',
-            'have', 'here', 'they', 'will', 'with', 'this', 'that', 'what', 'when', 'where',
-            'were', 'said', 'each', 'make', 'most', 'over', 'such', 'very', 'well', 'work'
-        }
+        # The pattern already matches both cases, so only the matched words are
+        # lowercased instead of copying the whole text
+        words = map(str.lower, _keyword_pattern(min_length).findall(text))
         
         # Filter stop words and count frequency
-        filtered_words = [word for word in words if word not in stop_words]
-        word_counts = Counter(filtered_words)
+        word_counts = Counter(word for word in words if word not in STOP_WORDS)
         
         # Return most common keywords
         return [word for word, count in word_counts.most_common(max_keywords)]
@@ -53,44 +78,37 @@ class TextProcessor:
     @staticmethod
     def extract_sentences(text: str) -> List[str]:
         """Extract sentences from text"""
-        # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(TextProcessor.iter_sentences(text))
+    
+    @staticmethod
+    def iter_sentences(text: str) -> Iterator[str]:
+        """Yield sentences one at a time without materializing the whole split"""
+        # Simple sentence splitting on runs of terminal punctuation
+        start = 0
+        for match in SENTENCE_SPLIT_PATTERN.finditer(text):
+            sentence = text[start:match.start()].strip()
+            if sentence:
+                yield sentence
+            start = match.end()
+        
+        sentence = text[start:].strip()
+        if sentence:
+            yield sentence
     
     @staticmethod
     def find_citations(text: str) -> List[str]:
         """Find citation patterns in text"""
-        # Look for various citation patterns
-        patterns = [
-            r'\(([^)]*\d{4}[^)]*)\)',  # (Author 2023)
-            r'\[(\d+)\]',              # [1]
-            r'doi:\s*([^\s]+)',        # doi: 10.1000/182
-            r'PMID:\s*(\d+)',          # PMID: 12345678
-        ]
-        
-        citations = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            citations.extend(matches)
-        
-        return citations
+        # Look for various citation patterns; each is scanned separately so
+        # overlapping forms (a doi inside parentheses) are all reported
+        return [citation for pattern in CITATION_PATTERNS for citation in pattern.findall(text)]
     
     @staticmethod
     def extract_authors(text: str) -> List[str]:
         """Extract author names from text"""
-        # Look for patterns like "Smith et al." or "John Smith"
-        patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+et\s+al\.?',  # Smith et al.
-            r'([A-Z][a-z]+,\s+[A-Z]\.(?:\s+[A-Z]\.)*)',       # Smith, J. A.
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)',                   # John Smith
-        ]
-        
-        authors = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            authors.extend(matches)
-        
-        return list(set(authors))  # Remove duplicates
+        # Look for patterns like "Smith et al." or "John Smith", each scanned separately
+        # so names inside a longer match are kept; dict.fromkeys removes duplicates
+        # while keeping first-seen order
+        return list(dict.fromkeys(author for pattern in AUTHOR_PATTERNS for author in pattern.findall(text)))
     
     @staticmethod
     def calculate_readability_score(text: str) -> float:
@@ -98,14 +116,14 @@ class TextProcessor:
         if not text:
             return 0.0
         
-        sentences = TextProcessor.extract_sentences(text)
+        sentence_count = sum(1 for _ in TextProcessor.iter_sentences(text))
         words = text.split()
         
-        if not sentences or not words:
+        if not sentence_count or not words:
             return 0.0
         
-        avg_sentence_length = len(words) / len(sentences)
-        avg_word_length = sum(len(word) for word in words) / len(words)
+        avg_sentence_length = len(words) / sentence_count
+        avg_word_length = sum(map(len, words)) / len(words)
         
         # Simple formula (lower values = more readable)
         score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * avg_word_length / 4.7)
@@ -119,8 +137,9 @@ class TextProcessor:
         if not text:
             return "unknown"
         
-        cyrillic_chars = len(re.findall(r'[а-яё]', text.lower()))
-        latin_chars = len(re.findall(r'[a-z]', text.lower()))
+        text = text.lower()
+        cyrillic_chars = len(text) - len(text.translate(CYRILLIC_LETTERS))
+        latin_chars = len(text) - len(text.translate(LATIN_LETTERS))
         
         total_chars = cyrillic_chars + latin_chars
         if total_chars == 0: